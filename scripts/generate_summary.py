@@ -3,202 +3,99 @@
 Generate summary from existing CSV files.
 """
 
-import csv
 from pathlib import Path
-from collections import defaultdict
 from datetime import datetime
 
+from scan_contracts import analyze_csv, analyze_year_from_all_csv
 
-def analyze_csv(csv_path):
-    """Analyze a CSV file and return statistics."""
-    stats = {
-        'total_contracts': 0,
-        'critical_errors': 0,
-        'errors': 0,
-        'warnings': 0,
-        'clean': 0,
-        'by_office': defaultdict(int),
-        'by_region': defaultdict(int),
-        'by_status': defaultdict(int),
-        'total_cost': 0.0,
-        'contracts_with_cost': 0,
-    }
-    
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            stats['total_contracts'] += 1
-            
-            # Error tracking
-            if row.get('critical_errors'):
-                stats['critical_errors'] += 1
-            if row.get('errors'):
-                stats['errors'] += 1
-            if row.get('warnings'):
-                stats['warnings'] += 1
-            if not any([row.get('critical_errors'), row.get('errors'), row.get('warnings')]):
-                stats['clean'] += 1
-            
-            # Office/Region
-            source_office = row.get('source_office', 'Unknown')
-            stats['by_office'][source_office] += 1
-            
-            region = row.get('region', 'Unknown')
-            stats['by_region'][region] += 1
-            
-            # Status
-            status = row.get('status', 'Unknown')
-            stats['by_status'][status] += 1
-            
-            # Cost
-            cost_str = row.get('cost_php', '')
-            if cost_str:
-                try:
-                    cost = float(cost_str)
-                    stats['total_cost'] += cost
-                    stats['contracts_with_cost'] += 1
-                except ValueError:
-                    pass
-    
-    return stats
+# Output buffer size for the markdown writer (64 KiB)
+WRITE_BUFFER_SIZE = 1 << 16
 
 
-def analyze_year_from_all_csv(csv_path):
-    """Analyze CSV and group by year."""
-    by_year = defaultdict(lambda: {
-        'total_contracts': 0,
-        'critical_errors': 0,
-        'errors': 0,
-        'warnings': 0,
-        'clean': 0,
-        'by_office': defaultdict(int),
-        'by_region': defaultdict(int),
-        'by_status': defaultdict(int),
-        'total_cost': 0.0,
-        'contracts_with_cost': 0,
-    })
-    
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            year_str = row.get('year', '')
-            if not year_str:
-                continue
-            
-            try:
-                year = int(year_str)
-            except ValueError:
-                continue
-            
-            stats = by_year[year]
-            stats['total_contracts'] += 1
-            
-            # Error tracking
-            if row.get('critical_errors'):
-                stats['critical_errors'] += 1
-            if row.get('errors'):
-                stats['errors'] += 1
-            if row.get('warnings'):
-                stats['warnings'] += 1
-            if not any([row.get('critical_errors'), row.get('errors'), row.get('warnings')]):
-                stats['clean'] += 1
-            
-            # Office/Region
-            source_office = row.get('source_office', 'Unknown')
-            stats['by_office'][source_office] += 1
-            
-            region = row.get('region', 'Unknown')
-            stats['by_region'][region] += 1
-            
-            # Status
-            status = row.get('status', 'Unknown')
-            stats['by_status'][status] += 1
-            
-            # Cost
-            cost_str = row.get('cost_php', '')
-            if cost_str:
-                try:
-                    cost = float(cost_str)
-                    stats['total_cost'] += cost
-                    stats['contracts_with_cost'] += 1
-                except ValueError:
-                    pass
+def generate_summary_markdown(years_data, output_path):
+    """Generate a markdown summary of all parsed data."""
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        write = f.write
+        _write_summary(write, years_data)
     
-    return dict(by_year)
+    print(f"✓ Summary written to: {output_path}")
 
 
-def generate_summary_markdown(years_data, output_path):
-    """Generate a markdown summary of all parsed data."""
-    lines = []
+def _write_counts(write, counts, pct_scale):
+    """Write one '- name: count (pct%)' line per (name, count) pair.
     
-    lines.append("# DPWH Contracts Data Summary")
-    lines.append(f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("\n---\n")
+    pct_scale is 100 / total, so each percentage is a single multiply.
+    """
+    write(''.join([f"- {name}: {count:,} ({count * pct_scale:.1f}%)\n" for name, count in counts]))
+
+
+def _write_summary(write, years_data):
+    """Write the summary markdown line by line through write()."""
+    write("# DPWH Contracts Data Summary\n")
+    write(f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    write("\n---\n\n")
     
     # Overall summary
-    lines.append("## Overall Summary\n")
+    write("## Overall Summary\n\n")
     total_all = sum(data['total_contracts'] for data in years_data.values())
     total_cost_all = sum(data['total_cost'] for data in years_data.values())
     
-    lines.append(f"- **Total Contracts Parsed**: {total_all:,}")
-    lines.append(f"- **Total Contract Value**: ₱{total_cost_all:,.2f}")
-    lines.append(f"- **Years Covered**: {min(years_data.keys())} - {max(years_data.keys())}")
-    lines.append(f"- **Number of Years**: {len(years_data)}")
-    lines.append("")
+    write(f"- **Total Contracts Parsed**: {total_all:,}\n")
+    write(f"- **Total Contract Value**: ₱{total_cost_all:,.2f}\n")
+    write(f"- **Years Covered**: {min(years_data.keys())} - {max(years_data.keys())}\n")
+    write(f"- **Number of Years**: {len(years_data)}\n")
+    write("\n")
     
     # Collect all unique offices
     all_offices = set()
     for data in years_data.values():
         all_offices.update(data['by_office'].keys())
-    lines.append(f"- **Offices Represented**: {len(all_offices)}")
-    lines.append("")
+    write(f"- **Offices Represented**: {len(all_offices)}\n")
+    write("\n")
     
     # Per-year breakdown
-    lines.append("## Per-Year Breakdown\n")
+    write("## Per-Year Breakdown\n\n")
     
     for year in sorted(years_data.keys()):
         data = years_data[year]
-        lines.append(f"### {year}\n")
+        write(f"### {year}\n\n")
+        
+        # An empty year (e.g. a header-only CSV) has nothing to break down
+        if not data['total_contracts']:
+            write("No contracts\n\n")
+            write("---\n\n")
+            continue
+        pct_scale = 100.0 / data['total_contracts']
         
-        lines.append("**Contract Statistics:**")
-        lines.append(f"- Total Contracts: {data['total_contracts']:,}")
-        lines.append(f"- Clean Contracts: {data['clean']:,} ({data['clean']/data['total_contracts']*100:.1f}%)")
-        lines.append(f"- Contracts with Critical Errors: {data['critical_errors']:,}")
-        lines.append(f"- Contracts with Errors: {data['errors']:,}")
-        lines.append(f"- Contracts with Warnings: {data['warnings']:,}")
-        lines.append("")
+        write("**Contract Statistics:**\n")
+        write(f"- Total Contracts: {data['total_contracts']:,}\n")
+        write(f"- Clean Contracts: {data['clean']:,} ({data['clean'] * pct_scale:.1f}%)\n")
+        write(f"- Contracts with Critical Errors: {data['critical_errors']:,}\n")
+        write(f"- Contracts with Errors: {data['errors']:,}\n")
+        write(f"- Contracts with Warnings: {data['warnings']:,}\n")
+        write("\n")
         
-        lines.append("**Financial Statistics:**")
+        write("**Financial Statistics:**\n")
         if data['contracts_with_cost'] > 0:
             avg_cost = data['total_cost'] / data['contracts_with_cost']
-            lines.append(f"- Total Contract Value: ₱{data['total_cost']:,.2f}")
-            lines.append(f"- Contracts with Cost Data: {data['contracts_with_cost']:,} ({data['contracts_with_cost']/data['total_contracts']*100:.1f}%)")
-            lines.append(f"- Average Contract Value: ₱{avg_cost:,.2f}")
+            write(f"- Total Contract Value: ₱{data['total_cost']:,.2f}\n")
+            write(f"- Contracts with Cost Data: {data['contracts_with_cost']:,} ({data['contracts_with_cost'] * pct_scale:.1f}%)\n")
+            write(f"- Average Contract Value: ₱{avg_cost:,.2f}\n")
         else:
-            lines.append("- No cost data available")
-        lines.append("")
+            write("- No cost data available\n")
+        write("\n")
         
-        lines.append("**By Source Office (Top 10):**")
-        for office, count in sorted(data['by_office'].items(), key=lambda x: x[1], reverse=True)[:10]:
-            pct = count / data['total_contracts'] * 100
-            lines.append(f"- {office}: {count:,} ({pct:.1f}%)")
+        write("**By Source Office (Top 10):**\n")
+        _write_counts(write, data['by_office'].most_common(10), pct_scale)
         if len(data['by_office']) > 10:
-            lines.append(f"- ... and {len(data['by_office']) - 10} more offices")
-        lines.append("")
+            write(f"- ... and {len(data['by_office']) - 10} more offices\n")
+        write("\n")
         
-        lines.append("**By Contract Status:**")
-        for status, count in sorted(data['by_status'].items(), key=lambda x: x[1], reverse=True):
-            pct = count / data['total_contracts'] * 100
-            lines.append(f"- {status}: {count:,} ({pct:.1f}%)")
-        lines.append("")
+        write("**By Contract Status:**\n")
+        _write_counts(write, data['by_status'].most_common(), pct_scale)
+        write("\n")
         
-        lines.append("---\n")
-    
-    # Write to file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
-    
-    print(f"✓ Summary written to: {output_path}")
+        write("---\n\n")
 
 
 def main():
@@ -5,28 +5,46 @@ Extracts contract data from HTML tables and converts to standardized CSV format.
 """
 
 import csv
+import os
 import re
+import string
 import logging
+from sys import intern
 from pathlib import Path
+from datetime import datetime
 from html import unescape
+from types import MappingProxyType
 from typing import List, Dict, Tuple, Optional
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
 
-from bs4 import BeautifulSoup
+from lxml import etree
 from dateutil import parser as date_parser
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/parser.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
 
+def setup_logging():
+    """Log to logs/parser.log and the console.
+    
+    Called by the script and by each pool worker rather than at import time, so
+    importing the module never needs logs/ to exist. Forked workers inherit the
+    parent's handlers and basicConfig is then a no-op; spawned workers get their own.
+    """
+    Path('logs').mkdir(exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('logs/parser.log'),
+            logging.StreamHandler()
+        ]
+    )
+
+
 # CSV Field Names
 CSV_FIELDS = [
     'row_number', 'contract_id', 'description',
@@ -41,6 +59,13 @@ CSV_FIELDS = [
     'critical_errors', 'errors', 'warnings', 'info_notes'
 ]
 
+# Contract dict -> CSV row tuple in CSV_FIELDS order (extract_contract_data sets every field)
+csv_row = itemgetter(*CSV_FIELDS)
+
+# CSV row -> (critical_errors, errors, warnings, info_notes)
+note_columns = itemgetter(*(CSV_FIELDS.index(field) for field in
+                            ('critical_errors', 'errors', 'warnings', 'info_notes')))
+
 
 class ParseError:
     """Constants for parse error codes and messages."""
@@ -72,6 +97,7 @@ class ParseError:
     EXTRA_CONTRACTORS = ("WARN-041", "{count} contractors found, stored in 4 columns (excess combined in column 4)")
     CONTRACTOR_MISSING_ID = ("ERR-042", "Contractor missing ID code: '{name}'")
     CONTRACTOR_NAME_HAS_SLASH = ("WARN-043", "Contractor name contains slash (/) - may need manual review: '{name}'")
+    CONTRACTOR_NAME_TRUNCATED = ("WARN-044", "Contractor name appears truncated: '{name}'")
     JOINT_VENTURE_INFO = ("INFO-045", "Joint venture with {count} contractors")
     
     # HTML Structure
@@ -79,6 +105,36 @@ class ParseError:
     NO_TR = ("CRIT-052", "No tr element in tbody")
 
 
+# Shared, read-only note columns for the (common) case where nothing was noted
+EMPTY_NOTES = MappingProxyType({
+    'critical_errors': None,
+    'errors': None,
+    'warnings': None,
+    'info_notes': None
+})
+
+
+# Error code prefix -> ParseNotes list it is recorded in
+SEVERITY_BY_PREFIX = {
+    'CRIT': 'critical',
+    'ERR': 'errors',
+    'WARN': 'warnings',
+    'INFO': 'info'
+}
+
+# Every ParseError code -> its ParseNotes list, resolved once at import
+NOTE_SEVERITIES = {
+    error[0]: SEVERITY_BY_PREFIX[error[0].partition('-')[0]]
+    for name, error in vars(ParseError).items() if name.isupper()
+}
+
+# Full "CODE: message" text of every ParseError, for notes added without arguments
+NOTE_MESSAGES = {
+    error: f"{error[0]}: {error[1]}"
+    for name, error in vars(ParseError).items() if name.isupper()
+}
+
+
 class ParseNotes:
     """Helper class for managing parse notes with severity separation."""
     
@@ -92,19 +148,14 @@ class ParseNotes:
         """Add a parse note using error tuple."""
         code, message = error_tuple
         if kwargs:
-            message = message.format(**kwargs)
-        
-        full_message = f"{code}: {message}"
+            full_message = f"{code}: {message.format(**kwargs)}"
+        else:
+            full_message = NOTE_MESSAGES.get(error_tuple) or f"{code}: {message}"
         
-        # Route to appropriate list based on code prefix
-        if code.startswith("CRIT-"):
-            self.critical.append(full_message)
-        elif code.startswith("ERR-"):
-            self.errors.append(full_message)
-        elif code.startswith("WARN-"):
-            self.warnings.append(full_message)
-        elif code.startswith("INFO-"):
-            self.info.append(full_message)
+        # Route to appropriate list; codes outside ParseError fall back to the prefix
+        severity = NOTE_SEVERITIES.get(code) or SEVERITY_BY_PREFIX.get(code.partition('-')[0])
+        if severity:
+            getattr(self, severity).append(full_message)
     
     def get_by_severity(self, severity, max_length=500):
         """Get notes for specific severity level."""
@@ -121,7 +172,9 @@ class ParseNotes:
         return notes_str
     
     def get_all_columns(self, max_length=500):
-        """Get all notes as dict for CSV columns."""
+        """Get all notes as dict for CSV columns (EMPTY_NOTES if there are none)."""
+        if not (self.critical or self.errors or self.warnings or self.info):
+            return EMPTY_NOTES
         return {
             'critical_errors': self.get_by_severity('critical', max_length),
             'errors': self.get_by_severity('errors', max_length),
@@ -132,17 +185,13 @@ class ParseNotes:
     def has_critical(self):
         """Check if any CRITICAL notes exist."""
         return len(self.critical) > 0
-    
-    def merge(self, other_columns):
-        """Merge error columns from another source."""
-        if other_columns.get('critical_errors'):
-            self.critical.append(other_columns['critical_errors'])
-        if other_columns.get('errors'):
-            self.errors.append(other_columns['errors'])
-        if other_columns.get('warnings'):
-            self.warnings.append(other_columns['warnings'])
-        if other_columns.get('info_notes'):
-            self.info.append(other_columns['info_notes'])
+
+
+# Scraped file stem: table_{office_name}_{year}_{date}_{time}
+# Example: table_Central_Office_2016_20251111_155202 -> ('Central_Office', '2016')
+# The timestamp parts are not validated: some scrapes have a short date
+# (e.g. table_Central-Office_2025_1111_153954).
+HTML_FILENAME_PATTERN = re.compile(r'^table_(.+)_(\d{4})_[^_]*_[^_]*$')
 
 
 def discover_html_files(directory: str = 'html', year_filter: Optional[int] = None) -> List[Tuple[Path, int, str]]:
@@ -150,65 +199,237 @@ def discover_html_files(directory: str = 'html', year_filter: Optional[int] = No
     
     Returns: List of (filepath, year, office_name) tuples
     """
-    pattern = 'table_*.html'
     files = []
     
-    for filepath in Path(directory).glob(pattern):
-        # Extract office name from filename: table_{office_name}_{year}_{date}_{time}.html
-        # The filename structure has timestamp split into date and time with underscore
-        # Example: table_Central_Office_2016_20251111_155202.html
-        # Split and work backwards: [...office_parts..., year, date, time]
-        name_without_ext = filepath.stem  # Remove .html
-        parts = name_without_ext.split('_')
-        
-        if len(parts) >= 4 and parts[-3].isdigit() and len(parts[-3]) == 4:
-            # parts[-3] should be the year (4 digits)
-            # parts[1:-3] should be the office name parts
-            year = int(parts[-3])
-            office_parts = parts[1:-3]  # Skip 'table' prefix and last 3 (year, date, time)
-            office_name = ' '.join(office_parts)
+    if not os.path.isdir(directory):
+        return files
+    
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith('table_') and name.endswith('.html')) or entry.is_dir():
+                continue
+            
+            match = HTML_FILENAME_PATTERN.match(name[:-len('.html')])
+            if not match:
+                logger.warning(f"Could not extract year/office from filename: {name}")
+                continue
+            
+            year = int(match.group(2))
+            office_name = match.group(1).replace('_', ' ')
             
             if year_filter is None or year == year_filter:
-                files.append((filepath, year, office_name))
-        else:
-            logger.warning(f"Could not extract year/office from filename: {filepath.name}")
+                files.append((Path(entry.path), year, office_name))
     
-    return sorted(files, key=lambda x: (x[1], x[2]))
+    return sorted(files, key=itemgetter(1, 2))
 
 
-def parse_html_file(filepath: Path) -> BeautifulSoup:
-    """Parse HTML file with BeautifulSoup."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-    return BeautifulSoup(html_content, 'lxml')
+# Span ID patterns used by the ASP.NET repeater
+SPAN_ID_PATTERNS = (
+    'lblCustomerId', 'lblContactName', 'lblCountry',
+    'Label1', 'Label2', 'Label3', 'Label4', 'Label5', 'Label6', 'Label7',
+)
 
 
-def extract_contracts(soup: BeautifulSoup) -> List:
-    """Extract contract tbody elements."""
-    tbodies = soup.find_all('tbody', class_='table-group-divider')
-    valid_tbodies = []
-    
-    for tbody in tbodies:
-        tr = tbody.find('tr')
-        if tr and tr.find('th', scope='row'):
-            valid_tbodies.append(tbody)
+@lru_cache(maxsize=1024)
+def _patterns_in(text: str) -> Tuple[str, ...]:
+    """Return the SPAN_ID_PATTERNS contained in text (cached per distinct text)."""
+    return tuple(p for p in SPAN_ID_PATTERNS if p in text)
+
+
+def span_id_patterns(span_id: str) -> Tuple[str, ...]:
+    """Return the SPAN_ID_PATTERNS contained in a span id.
     
-    return valid_tbodies
+    Repeater ids end in the row index (Repeater1_Label5_0, Repeater1_Label5_1, ...)
+    and no pattern contains '_' or is all digits, so the lookup is cached on the
+    id without that suffix: one dict hit per span instead of ten substring scans.
+    """
+    head, _, tail = span_id.rpartition('_')
+    if tail.isdigit():
+        return _patterns_in(head)
+    return _patterns_in(span_id)
 
 
-def extract_span_by_pattern(tr, pattern: str) -> Optional[str]:
-    """Extract text from span with ID pattern."""
-    span = tr.find('span', id=lambda x: x and pattern in x)
-    return span.get_text(strip=True) if span else None
+# Read buffer size for HTML files (1 MiB)
+READ_BUFFER_SIZE = 1 << 20
 
 
-def clean_cost(cost_text: Optional[str]) -> Tuple[Optional[float], Dict]:
-    """Clean and convert cost to float."""
-    notes = ParseNotes()
+class ContractTarget:
+    """lxml parser target that collects contract fields while the HTML streams past.
+    
+    A contract is a <tbody class="table-group-divider"> whose first <tr> has a
+    <th scope="row">. Within that tr, the first span whose id contains each of
+    SPAN_ID_PATTERNS and the row header are captured as their stripped text
+    nodes joined together (BeautifulSoup's get_text(strip=True)). No tree is
+    built; close() returns one {pattern: text, 'row_number': text} dict per
+    contract, in document order.
+    """
+    
+    def __init__(self):
+        self.contracts = []
+        self._depth = 0
+        self._fields = None      # fields of the tbody being read, None outside one
+        self._tbody_depth = 0
+        self._tr_depth = None    # depth of the tbody's first tr while inside it
+        self._tr_seen = False
+        self._claimed = set()    # fields already captured (first match wins)
+        self._stack = []         # per open element in the tr: fields it captures, or None
+        self._open = []          # (fields, pieces) for each capturing element still open
+        self._text = ''          # current text node, as delivered so far
+    
+    def _flush(self):
+        """Add the pending text node, stripped, to every open capture."""
+        text = self._text.strip()
+        self._text = ''
+        if text:
+            for _, pieces in self._open:
+                pieces.append(text)
+    
+    def start(self, tag, attrib):
+        if self._text:
+            self._flush()
+        self._depth += 1
+        
+        if self._fields is None:
+            if tag == 'tbody' and 'table-group-divider' in attrib.get('class', '').split():
+                self._fields = {}
+                self._tbody_depth = self._depth
+                self._tr_depth = None
+                self._tr_seen = False
+                self._claimed.clear()
+            return
+        
+        if self._tr_depth is None:
+            if tag == 'tr' and not self._tr_seen:
+                self._tr_depth = self._depth
+                self._tr_seen = True
+            return
+        
+        fields = None
+        if tag == 'span':
+            span_id = attrib.get('id')
+            if span_id:
+                fields = [p for p in span_id_patterns(span_id) if p not in self._claimed]
+        elif tag == 'th' and attrib.get('scope') == 'row' and 'row_number' not in self._claimed:
+            fields = ['row_number']
+        
+        if fields:
+            self._claimed.update(fields)
+            self._open.append((fields, []))
+        else:
+            fields = None
+        self._stack.append(fields)
+    
+    def end(self, tag):
+        if self._text:
+            self._flush()
+        depth = self._depth
+        self._depth -= 1
+        
+        if self._fields is None:
+            return
+        
+        if self._tr_depth is not None:
+            if depth == self._tr_depth:
+                self._tr_depth = None
+            elif self._stack.pop() is not None:
+                fields, pieces = self._open.pop()
+                text = ''.join(pieces)
+                for field in fields:
+                    self._fields[field] = text
+        elif depth == self._tbody_depth:
+            if 'row_number' in self._fields:
+                self.contracts.append(self._fields)
+            self._fields = None
+    
+    def data(self, data):
+        if self._open:
+            self._text += data
+    
+    def comment(self, text):
+        # Comments split text nodes but contribute no text
+        if self._text:
+            self._flush()
+    
+    def close(self):
+        return self.contracts
+
+
+# Fast-path scanner for the fixed ASP.NET repeater markup (see scan_contract_fields)
+CONTRACT_TBODY_TAG = '<tbody class="table-group-divider">'
+ROW_HEADER_PATTERN = re.compile(r'[ \t\n]*<tr>[ \t\n]*<th scope="row">([^<&]*)</th>')
+SPAN_PATTERN = re.compile(r'<span id="([^"&]*)">([^<]*)</span>')
+TAG_NAME_PATTERN = re.compile(r'</?([a-zA-Z0-9]+)')
+ROW_TAGS = frozenset(('td', 'b', 'ul', 'li', 'span', 'br'))
+
+
+def scan_contract_fields(html_content: bytes) -> Optional[List[Dict[str, str]]]:
+    """Extract the same fields as ContractTarget with string scans, or return None.
+    
+    The scraped tables come from one ASP.NET template: every contract starts with
+    a bare <tbody class="table-group-divider"><tr><th scope="row">, and its first
+    row holds only td/b/ul/li/br tags and plain <span id="...">text</span> leaves.
+    Markup like that parses to exactly the tree the regexes assume, so the spans
+    can be read without running libxml2. Anything else - other tags or attributes,
+    comments, entities other than &amp;, CRs, bad UTF-8 - returns None and the
+    caller uses the full parser for that file.
+    """
+    try:
+        text = html_content.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+    if ('\r' in text or '\x00' in text or '<!--' in text
+            or text.count('table-group-divider') != text.count(CONTRACT_TBODY_TAG)):
+        return None
+    
+    contracts = []
+    for chunk in text.split(CONTRACT_TBODY_TAG)[1:]:
+        header = ROW_HEADER_PATTERN.match(chunk)
+        tr_end = chunk.find('</tr>')
+        if not header or tr_end < 0 or chunk.find('</tbody>') < tr_end:
+            return None
+        row = chunk[header.end():tr_end]
+        if not ROW_TAGS.issuperset(TAG_NAME_PATTERN.findall(row)):
+            return None
+        spans = SPAN_PATTERN.findall(row)
+        if len(spans) != row.count('<span') or len(spans) != row.count('</span'):
+            return None
+        
+        fields = {'row_number': header.group(1).strip()}
+        for span_id, value in spans:
+            if '&' in value:
+                if '&' in value.replace('&amp;', ''):
+                    return None
+                value = value.replace('&amp;', '&')
+            value = value.strip()
+            for pattern in span_id_patterns(span_id):
+                if pattern not in fields:
+                    fields[pattern] = value
+        contracts.append(fields)
+    return contracts
+
+
+def parse_html_file(filepath: Path) -> List[Dict[str, str]]:
+    """Read an HTML file and return its contracts' raw fields."""
+    with open(filepath, 'rb', buffering=READ_BUFFER_SIZE) as f:
+        html_content = f.read()
+    
+    contracts = scan_contract_fields(html_content)
+    if contracts is not None:
+        return contracts
+    
+    # The saved tables have no <meta charset>, so tell libxml2 they are UTF-8
+    # rather than letting it fall back to Latin-1 for raw bytes
+    parser = etree.HTMLParser(target=ContractTarget(), encoding='utf-8')
+    return etree.fromstring(html_content, parser)
+
+
+def clean_cost(cost_text: Optional[str], notes: ParseNotes) -> Optional[float]:
+    """Clean and convert cost to float, adding any problems to notes."""
     
     if not cost_text or cost_text.strip() == '':
         notes.add(ParseError.EMPTY_COST)
-        return None, notes.get_all_columns()
+        return None
     
     try:
         cleaned = cost_text.replace(',', '')
@@ -216,53 +437,123 @@ def clean_cost(cost_text: Optional[str]) -> Tuple[Optional[float], Dict]:
         
         if value < 0:
             notes.add(ParseError.NEGATIVE_COST, value=value)
-            return None, notes.get_all_columns()
+            return None
         
-        return value, notes.get_all_columns()
+        return value
         
     except ValueError:
         notes.add(ParseError.INVALID_COST, value=cost_text)
-        return None, notes.get_all_columns()
+        return None
 
 
-def parse_date(date_text: Optional[str], field_name: str = 'date') -> Tuple[Optional[str], Dict]:
-    """Parse date to ISO format."""
-    notes = ParseNotes()
+# Date formats tried with strptime before falling back to dateutil,
+# most frequent first (every dated row in the 2016-2025 scrape is "July 7, 2016")
+DATE_FORMATS = ('%B %d, %Y', '%Y-%m-%d', '%m/%d/%Y')
+
+
+@lru_cache(maxsize=4096)
+def to_iso_date(date_text: str) -> Optional[str]:
+    """Convert a non-empty date string to YYYY-MM-DD, or None if it can't be parsed.
+    
+    Cached: a year's contracts share a few hundred distinct dates.
+    """
+    # Fast path: the DPWH pages render dates in a fixed format
+    for date_format in DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(date_text, date_format)
+            return parsed.strftime('%Y-%m-%d')
+        except ValueError:
+            pass
+    
+    try:
+        parsed = date_parser.parse(date_text)
+        return parsed.strftime('%Y-%m-%d')
+    except (ValueError, TypeError):
+        return None
+
+
+def parse_date(date_text: Optional[str], notes: ParseNotes, field_name: str = 'date') -> Optional[str]:
+    """Parse date to ISO format, adding any problems to notes."""
     
     if not date_text or date_text.strip() == '':
         if field_name == 'effectivity':
             notes.add(ParseError.EMPTY_EFFECTIVITY)
         elif field_name == 'expiry':
             notes.add(ParseError.EMPTY_EXPIRY)
-        return None, notes.get_all_columns()
+        return None
     
-    try:
-        parsed = date_parser.parse(date_text)
-        return parsed.strftime('%Y-%m-%d'), notes.get_all_columns()
-    except (ValueError, TypeError):
+    iso_date = to_iso_date(date_text)
+    if iso_date is None:
         if field_name == 'effectivity':
             notes.add(ParseError.INVALID_EFFECTIVITY, value=date_text)
         elif field_name == 'expiry':
             notes.add(ParseError.INVALID_EXPIRY, value=date_text)
-        return None, notes.get_all_columns()
+    return iso_date
 
 
-def clean_percentage(pct_text: Optional[str]) -> Tuple[Optional[float], Dict]:
-    """Convert percentage to float."""
-    notes = ParseNotes()
+def clean_percentage(pct_text: Optional[str], notes: ParseNotes) -> Optional[float]:
+    """Convert percentage to float, adding any problems to notes."""
     
     if not pct_text or pct_text.strip() == '':
         # Empty accomplishment is valid for not started
-        return None, notes.get_all_columns()
+        return None
     
     try:
         value = float(pct_text)
         if value < 0 or value > 100:
             notes.add(ParseError.PERCENTAGE_OUT_RANGE, value=value)
-        return value, notes.get_all_columns()
+        return value
     except ValueError:
         notes.add(ParseError.INVALID_PERCENTAGE, value=pct_text)
-        return None, notes.get_all_columns()
+        return None
+
+
+# Contractor parsing patterns.
+# CONTRACTOR_PATTERN finds all occurrences of: NAME (FORMER NAME) (ID)
+# or NAME (ID), and is robust to missing parens in former name.
+# ID can be numeric or alphanumeric with underscores (e.g., OECO_18941).
+CONTRACTOR_PATTERN = re.compile(r'(.*?\(.*?\))?\s*\(([A-Za-z0-9_]+)\)')
+TRAILING_ID_PATTERN = re.compile(r'\(([A-Za-z0-9_]+)\)\s*$')
+ID_PATTERN = re.compile(r'\(([A-Za-z0-9_]+)\)')
+CONTRACTOR_ID_CHARS = frozenset(string.ascii_letters + string.digits + '_')
+
+
+def split_simple_contractors(contractor_text: str) -> Optional[List[Tuple[str, Optional[str], bool, bool]]]:
+    """Fast path for parse_contractors without the regex.
+    
+    Handles text whose only parentheses are the "(ID)" suffixes, joined by
+    ") /" - the usual "COMPANY (ID)" and "COMPANY A (ID1) / COMPANY B (ID2)".
+    Returns None for anything else (former names, bad IDs, trailing text) so
+    the caller falls back to CONTRACTOR_PATTERN.
+    """
+    if '/' not in contractor_text:
+        # Single contractor (most rows): "COMPANY NAME (ID)"
+        if (contractor_text.count('(') != 1 or contractor_text.count(')') != 1
+                or not contractor_text.endswith(')')):
+            return None
+        name, _, contractor_id = contractor_text[:-1].partition('(')
+        if not contractor_id or not CONTRACTOR_ID_CHARS.issuperset(contractor_id):
+            return None
+        return [(name.strip(), contractor_id, False, False)]
+    
+    parts = contractor_text.split(') /')
+    last = len(parts) - 1
+    result = []
+    for i, part in enumerate(parts):
+        if i < last:
+            part += ')'
+        name, paren, contractor_id = part.rpartition('(')
+        if not paren or '(' in name or ')' in name or not contractor_id.endswith(')'):
+            return None
+        contractor_id = contractor_id[:-1]
+        if not contractor_id or not CONTRACTOR_ID_CHARS.issuperset(contractor_id):
+            return None
+        # The regex path sees the "/" separator as part of the next name
+        if i:
+            name = '/' + name
+        name = name.strip().lstrip('/').strip()
+        result.append((name, contractor_id, '/' in name, False))
+    return result
 
 
 def parse_contractors(contractor_text: Optional[str]) -> List[Tuple[str, Optional[str], bool]]:
@@ -283,19 +574,19 @@ def parse_contractors(contractor_text: Optional[str]) -> List[Tuple[str, Optiona
 
     contractor_text = unescape(contractor_text.strip())
 
+    simple = split_simple_contractors(contractor_text)
+    if simple is not None:
+        return simple
+
     # Improved splitting: split after (ID) pattern, keeping the ID with the contractor
-    # This regex finds all occurrences of: NAME (FORMER NAME) (ID)
-    # or NAME (ID), and is robust to missing parens in former name
-    # ID can be numeric or alphanumeric with underscores (e.g., OECO_18941)
-    contractor_pattern = re.compile(r'(.*?\(.*?\))?\s*\(([A-Za-z0-9_]+)\)')
-    matches = list(contractor_pattern.finditer(contractor_text))
+    matches = list(CONTRACTOR_PATTERN.finditer(contractor_text))
 
     result = []
     last_end = 0
     for match in matches:
         full_contractor = contractor_text[last_end:match.end()].strip()
         last_end = match.end()
-        id_match = re.search(r'\(([A-Za-z0-9_]+)\)\s*$', full_contractor)
+        id_match = TRAILING_ID_PATTERN.search(full_contractor)
         truncated = False
         if id_match:
             contractor_id = id_match.group(1)
@@ -311,7 +602,7 @@ def parse_contractors(contractor_text: Optional[str]) -> List[Tuple[str, Optiona
         else:
             fallback_id = None
             fallback_name = full_contractor.lstrip('/').strip()
-            fallback_id_match = re.search(r'\(([A-Za-z0-9_]+)\)', full_contractor)
+            fallback_id_match = ID_PATTERN.search(full_contractor)
             if fallback_id_match:
                 fallback_id = fallback_id_match.group(1)
                 fallback_name = full_contractor[:fallback_id_match.start()].lstrip('/').strip()
@@ -324,6 +615,7 @@ def parse_contractors(contractor_text: Optional[str]) -> List[Tuple[str, Optiona
     return result
 
 
+@lru_cache(maxsize=4096)
 def split_implementing_office(office_text: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
     """Split implementing office into region and office name.
     
@@ -343,13 +635,12 @@ def split_implementing_office(office_text: Optional[str]) -> Tuple[Optional[str]
         return None, parts[0].strip()
 
 
-def get_contractor_columns(contractor_text: Optional[str], max_contractors: int = 4) -> Tuple[Dict, Dict]:
-    """Parse contractors and return data dict + error columns dict.
+def get_contractor_columns(contractor_text: Optional[str], notes: ParseNotes, max_contractors: int = 4) -> Dict:
+    """Parse contractors and return the contractor columns, adding any problems to notes.
     
     If more than max_contractors are found, contractors 1-3 are stored normally,
     and contractors 4+ are combined in the 4th column (names and IDs separated by semicolons).
     """
-    notes = ParseNotes()
     
     if not contractor_text:
         notes.add(ParseError.MISSING_CONTRACTOR)
@@ -357,44 +648,38 @@ def get_contractor_columns(contractor_text: Optional[str], max_contractors: int
         for i in range(1, max_contractors + 1):
             result[f'contractor_name_{i}'] = None
             result[f'contractor_id_{i}'] = None
-        return result, notes.get_all_columns()
+        return result
     
     contractors = parse_contractors(contractor_text)
 
     result = {}
-
-    # Handle first 3 contractors normally
-    for i in range(1, max_contractors):
-        if i <= len(contractors):
-            name, contractor_id, has_stray_slash, truncated = contractors[i-1]
-            result[f'contractor_name_{i}'] = name
-            result[f'contractor_id_{i}'] = contractor_id
-            if not contractor_id:
-                notes.add(ParseError.CONTRACTOR_MISSING_ID, name=name[:30] if name else 'Unknown')
-            if has_stray_slash:
-                notes.add(ParseError.CONTRACTOR_NAME_HAS_SLASH, name=name[:50] if name else 'Unknown')
-            if truncated:
-                notes.add(("WARN-044", "Contractor name appears truncated: '{name}'"), name=name[:50] if name else 'Unknown')
+    last = max_contractors - 1
+    overflow_names = []
+    overflow_ids = []
+
+    # One pass: contractors 1-3 get their own columns, the rest go to the overflow lists
+    for i, (name, contractor_id, has_stray_slash, truncated) in enumerate(contractors):
+        if i < last:
+            result[f'contractor_name_{i + 1}'] = name
+            result[f'contractor_id_{i + 1}'] = contractor_id
         else:
-            result[f'contractor_name_{i}'] = None
-            result[f'contractor_id_{i}'] = None
-
-    # Handle 4th contractor and any excess contractors (combine them)
-    if len(contractors) >= max_contractors:
-        names = []
-        ids = []
-        for i in range(max_contractors - 1, len(contractors)):
-            name, contractor_id, has_stray_slash, truncated = contractors[i]
-            names.append(name)
-            ids.append(contractor_id if contractor_id else '')
-            if not contractor_id:
-                notes.add(ParseError.CONTRACTOR_MISSING_ID, name=name[:30] if name else 'Unknown')
-            if has_stray_slash:
-                notes.add(ParseError.CONTRACTOR_NAME_HAS_SLASH, name=name[:50] if name else 'Unknown')
-            if truncated:
-                notes.add(("WARN-044", "Contractor name appears truncated: '{name}'"), name=name[:50] if name else 'Unknown')
-        result[f'contractor_name_{max_contractors}'] = '; '.join(names)
-        result[f'contractor_id_{max_contractors}'] = '; '.join(ids)
+            overflow_names.append(name)
+            overflow_ids.append(contractor_id if contractor_id else '')
+        if not contractor_id:
+            notes.add(ParseError.CONTRACTOR_MISSING_ID, name=name[:30] if name else 'Unknown')
+        if has_stray_slash:
+            notes.add(ParseError.CONTRACTOR_NAME_HAS_SLASH, name=name[:50] if name else 'Unknown')
+        if truncated:
+            notes.add(ParseError.CONTRACTOR_NAME_TRUNCATED, name=name[:50] if name else 'Unknown')
+
+    for i in range(len(contractors) + 1, max_contractors):
+        result[f'contractor_name_{i}'] = None
+        result[f'contractor_id_{i}'] = None
+
+    # 4th contractor and any excess contractors are combined
+    if overflow_names:
+        result[f'contractor_name_{max_contractors}'] = '; '.join(overflow_names)
+        result[f'contractor_id_{max_contractors}'] = '; '.join(overflow_ids)
         if len(contractors) > max_contractors:
             notes.add(ParseError.EXTRA_CONTRACTORS, count=len(contractors))
     else:
@@ -404,41 +689,34 @@ def get_contractor_columns(contractor_text: Optional[str], max_contractors: int
     if len(contractors) > 1:
         notes.add(ParseError.JOINT_VENTURE_INFO, count=len(contractors))
 
-    return result, notes.get_all_columns()
+    return result
 
 
-def extract_contract_data(tbody, year: int, office_name: str, filename: str) -> Dict:
-    """Extract all fields from contract tbody."""
-    tr = tbody.find('tr')
-    if not tr:
-        logger.error("No tr element found in tbody")
-        return None
-    
+def extract_contract_data(fields: Dict[str, str], year: int, office_name: str, filename: str) -> Dict:
+    """Build a contract row from the raw fields ContractTarget collected for one tbody."""
     contract = {}
     notes = ParseNotes()
     
     # Row number
-    row_th = tr.find('th', scope='row')
-    contract['row_number'] = row_th.get_text(strip=True).rstrip('.') if row_th else None
+    row_number = fields.get('row_number')
+    contract['row_number'] = row_number.rstrip('.') if row_number is not None else None
     
     # Contract ID
-    contract['contract_id'] = extract_span_by_pattern(tr, 'lblCustomerId')
+    contract['contract_id'] = fields.get('lblCustomerId')
     if not contract['contract_id']:
         notes.add(ParseError.MISSING_CONTRACT_ID)
     
     # Description
-    contract['description'] = extract_span_by_pattern(tr, 'lblContactName')
+    contract['description'] = fields.get('lblContactName')
     if not contract['description']:
         notes.add(ParseError.MISSING_DESCRIPTION)
     
     # Contractors
-    contractor_text = extract_span_by_pattern(tr, 'lblCountry')
-    contractor_data, contractor_notes = get_contractor_columns(contractor_text, max_contractors=4)
-    contract.update(contractor_data)
-    notes.merge(contractor_notes)
+    contractor_text = fields.get('lblCountry')
+    contract.update(get_contractor_columns(contractor_text, notes, max_contractors=4))
     
     # Implementing office - split into region and office
-    office_raw = extract_span_by_pattern(tr, 'Label5')
+    office_raw = fields.get('Label5')
     if not office_raw:
         notes.add(ParseError.MISSING_OFFICE)
         contract['region'] = None
@@ -448,37 +726,34 @@ def extract_contract_data(tbody, year: int, office_name: str, filename: str) ->
         contract['region'] = region
         contract['implementing_office'] = office
     
-    contract['source_of_funds'] = extract_span_by_pattern(tr, 'Label6')
-    if not contract['source_of_funds']:
+    # Funds and status repeat across most rows; interning shares one string per
+    # value, which also keeps the rows pickled back from the workers small
+    # (region and office are already shared through split_implementing_office's cache)
+    funds = fields.get('Label6')
+    contract['source_of_funds'] = intern(funds) if funds else funds
+    if not funds:
         notes.add(ParseError.MISSING_FUNDS)
     
     # Cost
-    cost_raw = extract_span_by_pattern(tr, 'Label2')
-    cost_value, cost_notes = clean_cost(cost_raw)
-    contract['cost_php'] = cost_value
-    notes.merge(cost_notes)
+    cost_raw = fields.get('Label2')
+    contract['cost_php'] = clean_cost(cost_raw, notes)
     
     # Dates
-    effectivity_raw = extract_span_by_pattern(tr, 'Label3')
-    effectivity_value, effectivity_notes = parse_date(effectivity_raw, 'effectivity')
-    contract['effectivity_date'] = effectivity_value
-    notes.merge(effectivity_notes)
+    effectivity_raw = fields.get('Label3')
+    contract['effectivity_date'] = parse_date(effectivity_raw, notes, 'effectivity')
     
-    expiry_raw = extract_span_by_pattern(tr, 'Label4')
-    expiry_value, expiry_notes = parse_date(expiry_raw, 'expiry')
-    contract['expiry_date'] = expiry_value
-    notes.merge(expiry_notes)
+    expiry_raw = fields.get('Label4')
+    contract['expiry_date'] = parse_date(expiry_raw, notes, 'expiry')
     
     # Status
-    contract['status'] = extract_span_by_pattern(tr, 'Label7')
-    if not contract['status']:
+    status = fields.get('Label7')
+    contract['status'] = intern(status) if status else status
+    if not status:
         notes.add(ParseError.EMPTY_STATUS)
     
     # Accomplishment
-    accomplishment_raw = extract_span_by_pattern(tr, 'Label1')
-    accomplishment_value, accomplishment_notes = clean_percentage(accomplishment_raw)
-    contract['accomplishment_pct'] = accomplishment_value
-    notes.merge(accomplishment_notes)
+    accomplishment_raw = fields.get('Label1')
+    contract['accomplishment_pct'] = clean_percentage(accomplishment_raw, notes)
     
     # Metadata
     contract['year'] = year
@@ -491,20 +766,23 @@ def extract_contract_data(tbody, year: int, office_name: str, filename: str) ->
     return contract
 
 
-def process_html_file(filepath: Path, year: int, office_name: str) -> List[Dict]:
-    """Process single HTML file and return list of contracts."""
+def process_html_file(filepath: Path, year: int, office_name: str) -> List[Tuple]:
+    """Process single HTML file and return its contracts as CSV rows (CSV_FIELDS order).
+    
+    Tuples rather than dicts: they are what the writer needs, and they pickle
+    back from the worker processes smaller and faster.
+    """
     logger.info(f"Processing: {filepath.name} (Year: {year}, Office: {office_name})")
     
     try:
-        soup = parse_html_file(filepath)
-        tbodies = extract_contracts(soup)
+        contract_fields = parse_html_file(filepath)
         
         contracts = []
-        for tbody in tbodies:
+        for fields in contract_fields:
             try:
-                contract = extract_contract_data(tbody, year, office_name, filepath.name)
+                contract = extract_contract_data(fields, year, office_name, filepath.name)
                 if contract:
-                    contracts.append(contract)
+                    contracts.append(csv_row(contract))
             except Exception as e:
                 logger.error(f"Error extracting contract: {e}")
                 continue
@@ -517,16 +795,36 @@ def process_html_file(filepath: Path, year: int, office_name: str) -> List[Dict]
         return []
 
 
-def write_csv(contracts: List[Dict], output_path: Path):
-    """Write contracts to CSV file."""
-    logger.info(f"Writing {len(contracts)} contracts to {output_path}")
-    
-    with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDS)
-        writer.writeheader()
-        writer.writerows(contracts)
-    
-    logger.info(f"  Successfully wrote {output_path}")
+def _process_file_task(task: Tuple[Path, int, str]) -> List[Tuple]:
+    """Run process_html_file on a (filepath, year, office_name) tuple in a worker process."""
+    return process_html_file(*task)
+
+
+# Output buffer size for the streamed CSV writer (1 MiB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def note_codes(value: str):
+    """Yield the code (text before ':') of each non-empty '|'-separated note."""
+    for note in value.split('|'):
+        note = note.strip()
+        if note:
+            yield note.partition(':')[0]
+
+
+# Header rows of the per-code tables in the parse summary
+_TABLE_HEADER = (
+    "| Code | Message Template | Count |",
+    "|------|------------------|-------|",
+)
+
+
+def _format_section(title: str, counter: Counter, templates: Dict[str, str]) -> List[str]:
+    """Return the summary lines for one severity: heading, table header, one row per code."""
+    lines = [f"\n## {title}:"]
+    lines.extend(_TABLE_HEADER)
+    lines.extend([f"| {code} | {templates.get(code, '')} | {count} |" for code, count in counter.items()])
+    return lines
 
 
 def main(year_filter: Optional[int] = None):
@@ -534,10 +832,9 @@ def main(year_filter: Optional[int] = None):
     # Setup
     html_dir = Path('html')
     csv_dir = Path('csv')
-    logs_dir = Path('logs')
     
     csv_dir.mkdir(exist_ok=True)
-    logs_dir.mkdir(exist_ok=True)
+    setup_logging()
     
     # Discover files
     files = discover_html_files(html_dir, year_filter)
@@ -548,50 +845,68 @@ def main(year_filter: Optional[int] = None):
     
     logger.info(f"Found {len(files)} HTML file(s) to process")
     
-    # Process all files
-    all_contracts = []
-    for filepath, year, office_name in files:
-        contracts = process_html_file(filepath, year, office_name)
-        all_contracts.extend(contracts)
-    
-    # Write CSV
-    if all_contracts:
-        if year_filter:
-            output_path = csv_dir / f'contracts_{year_filter}_all_offices.csv'
-        else:
-            output_path = csv_dir / 'contracts_all_years_all_offices.csv'
-
-        write_csv(all_contracts, output_path)
-
-        # Statistics
-        total = len(all_contracts)
-        with_critical = sum(1 for c in all_contracts if c.get('critical_errors'))
-        with_errors = sum(1 for c in all_contracts if c.get('errors'))
-        with_warnings = sum(1 for c in all_contracts if c.get('warnings'))
-
-        # Count all subtypes for errors, warnings, infos
-        from collections import Counter
-        def split_notes(contracts, col):
-            notes = []
-            for c in contracts:
-                val = c.get(col)
-                if val:
-                    notes.extend([n.strip() for n in val.split('|')])
-            return notes
-
-        crit_counter = Counter()
-        err_counter = Counter()
-        warn_counter = Counter()
-        info_counter = Counter()
-        for c in all_contracts:
-            for note in split_notes([c], 'critical_errors'):
-                if note: crit_counter[note.split(':')[0]] += 1
-            for note in split_notes([c], 'errors'):
-                if note: err_counter[note.split(':')[0]] += 1
-            for note in split_notes([c], 'warnings'):
-                if note: warn_counter[note.split(':')[0]] += 1
-            for note in split_notes([c], 'info_notes'):
-                if note: info_counter[note.split(':')[0]] += 1
+    if year_filter:
+        output_path = csv_dir / f'contracts_{year_filter}_all_offices.csv'
+    else:
+        output_path = csv_dir / 'contracts_all_years_all_offices.csv'
+
+    # Statistics, updated as each file's contracts are written
+    total = 0
+    with_critical = 0
+    with_errors = 0
+    with_warnings = 0
+    crit_counter = Counter()
+    err_counter = Counter()
+    warn_counter = Counter()
+    info_counter = Counter()
+
+    # Process all files in parallel; map() yields results in discovery order.
+    # Each file's contracts are written as soon as they arrive, so only one
+    # file's worth of rows is held in memory. They go to a sibling temp file
+    # that replaces output_path only after every file has been parsed, so an
+    # interrupted run never leaves a truncated CSV behind. The temp file is
+    # opened on the first non-empty file so a run that extracts nothing leaves
+    # no output behind.
+    tmp_path = output_path.with_suffix('.csv.tmp')
+    csvfile = None
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=setup_logging) as executor:
+            for contracts in executor.map(_process_file_task, files, chunksize=4):
+                if not contracts:
+                    continue
+                if csvfile is None:
+                    logger.info(f"Writing contracts to {output_path}")
+                    csvfile = open(tmp_path, 'w', newline='', encoding='utf-8',
+                                   buffering=WRITE_BUFFER_SIZE)
+                    writer = csv.writer(csvfile)
+                    writer.writerow(CSV_FIELDS)
+                writer.writerows(contracts)
+
+                total += len(contracts)
+                for crit, err, warn, info in map(note_columns, contracts):
+                    if crit:
+                        with_critical += 1
+                        crit_counter.update(note_codes(crit))
+                    if err:
+                        with_errors += 1
+                        err_counter.update(note_codes(err))
+                    if warn:
+                        with_warnings += 1
+                        warn_counter.update(note_codes(warn))
+                    if info:
+                        info_counter.update(note_codes(info))
+
+        if csvfile is not None:
+            csvfile.close()
+            os.replace(tmp_path, output_path)
+    finally:
+        if csvfile is not None:
+            csvfile.close()
+            # Only left over when the run failed before the CSV was published
+            tmp_path.unlink(missing_ok=True)
+
+    if total:
+        logger.info(f"  Successfully wrote {total} contracts to {output_path}")
 
         # Message templates for each code (add new codes as needed)
         MESSAGE_TEMPLATES = {
@@ -628,35 +943,15 @@ def main(year_filter: Optional[int] = None):
         summary_lines.append(f"**Total contracts:** {total}")
         summary_lines.append(f"**Contracts with CRITICAL errors:** {with_critical}")
         if crit_counter:
-            summary_lines.append(f"\n## CRITICAL error subtypes:")
-            summary_lines.append(f"| Code | Message Template | Count |")
-            summary_lines.append(f"|------|------------------|-------|")
-            for k, v in crit_counter.items():
-                template = MESSAGE_TEMPLATES.get(k, '')
-                summary_lines.append(f"| {k} | {template} | {v} |")
+            summary_lines.extend(_format_section('CRITICAL error subtypes', crit_counter, MESSAGE_TEMPLATES))
         summary_lines.append(f"**Contracts with ERRORs:** {with_errors}")
         if err_counter:
-            summary_lines.append(f"\n## ERROR subtypes:")
-            summary_lines.append(f"| Code | Message Template | Count |")
-            summary_lines.append(f"|------|------------------|-------|")
-            for k, v in err_counter.items():
-                template = MESSAGE_TEMPLATES.get(k, '')
-                summary_lines.append(f"| {k} | {template} | {v} |")
+            summary_lines.extend(_format_section('ERROR subtypes', err_counter, MESSAGE_TEMPLATES))
         summary_lines.append(f"**Contracts with WARNINGs:** {with_warnings}")
         if warn_counter:
-            summary_lines.append(f"\n## WARNING subtypes:")
-            summary_lines.append(f"| Code | Message Template | Count |")
-            summary_lines.append(f"|------|------------------|-------|")
-            for k, v in warn_counter.items():
-                template = MESSAGE_TEMPLATES.get(k, '')
-                summary_lines.append(f"| {k} | {template} | {v} |")
+            summary_lines.extend(_format_section('WARNING subtypes', warn_counter, MESSAGE_TEMPLATES))
         if info_counter:
-            summary_lines.append(f"\n## INFO subtypes:")
-            summary_lines.append(f"| Code | Message Template | Count |")
-            summary_lines.append(f"|------|------------------|-------|")
-            for k, v in info_counter.items():
-                template = MESSAGE_TEMPLATES.get(k, '')
-                summary_lines.append(f"| {k} | {template} | {v} |")
+            summary_lines.extend(_format_section('INFO subtypes', info_counter, MESSAGE_TEMPLATES))
         summary_lines.append(f"**Clean contracts:** {total - with_critical - with_errors - with_warnings}")
 
         # Write summary to markdown file
@@ -673,6 +968,8 @@ def main(year_filter: Optional[int] = None):
 if __name__ == '__main__':
     import sys
     
+    setup_logging()
+    
     # Check for year argument
     year = None
     if len(sys.argv) > 1:
@@ -3,12 +3,118 @@
 Parse all DPWH HTML files and generate per-year summaries.
 """
 
-import csv
+import os
+import pickle
+import re
 import subprocess
 import sys
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
+from operator import itemgetter
+
+from scan_contracts import analyze_csv
+
+# Output buffer size for the markdown writer (64 KiB)
+WRITE_BUFFER_SIZE = 1 << 16
+
+# Lines of parser stderr shown when a parser run fails
+STDERR_TAIL_LINES = 20
+
+# Per-year analyze_csv results, reused while the CSV is unchanged
+CACHE_DIR = Path('.cache')
+# Bump when the shape or meaning of the analyze_csv stats changes
+CACHE_VERSION = 2
+
+# Scraped HTML file name: table_{office}_{year}_{date}_{time}.html
+HTML_YEAR_PATTERN = re.compile(r'^table_.+_(\d{4})_[^_]*_[^_]*\.html$')
+
+
+def latest_html_mtimes(directory='html'):
+    """Return {year: newest modification time} of the scraped HTML files."""
+    mtimes = defaultdict(float)
+    if not os.path.isdir(directory):
+        return mtimes
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            match = HTML_YEAR_PATTERN.match(entry.name)
+            if match:
+                year = int(match.group(1))
+                mtimes[year] = max(mtimes[year], entry.stat().st_mtime)
+    return mtimes
+
+
+def _stats_cache_path(year):
+    return CACHE_DIR / f'analyze_{year}.pkl'
+
+
+def load_cached_stats(year, csv_path):
+    """Return the cached analyze_csv stats for csv_path, or None if missing or stale."""
+    try:
+        with open(_stats_cache_path(year), 'rb') as f:
+            cached = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+    if cached.get('version') != CACHE_VERSION or cached.get('mtime') != csv_path.stat().st_mtime:
+        return None
+    return cached['stats']
+
+
+def save_cached_stats(year, csv_path, stats):
+    """Cache the analyze_csv stats for csv_path, keyed by its modification time."""
+    CACHE_DIR.mkdir(exist_ok=True)
+    with open(_stats_cache_path(year), 'wb') as f:
+        pickle.dump({'version': CACHE_VERSION, 'mtime': csv_path.stat().st_mtime, 'stats': stats}, f)
+
+
+# Error code descriptions for breakdowns
+CODE_DESCRIPTIONS = {
+    'ERR-001': 'Missing contract ID',
+    'ERR-002': 'Missing contract description',
+    'ERR-003': 'Missing contractor information',
+    'ERR-004': 'Missing implementing office',
+    'ERR-005': 'Missing source of funds',
+    'ERR-021': 'Invalid cost format',
+    'ERR-022': 'Negative cost value',
+    'ERR-023': 'Invalid percentage format',
+    'ERR-024': 'Percentage out of range',
+    'ERR-031': 'Invalid effectivity date format',
+    'ERR-032': 'Invalid expiry date format',
+    'ERR-033': 'Expiry date before effectivity date',
+    'ERR-042': 'Contractor missing ID code',
+    'ERR-044': 'Failed to parse contractor text',
+    'WARN-011': 'Empty cost field',
+    'WARN-012': 'Empty effectivity date',
+    'WARN-013': 'Empty expiry date',
+    'WARN-041': 'Multiple contractors found, stored in 4 columns (excess combined in column 4)',
+    'WARN-043': 'Contractor missing name, only ID found',
+    'WARN-061': 'Status/accomplishment mismatch',
+    'WARN-062': 'Status/expiry date mismatch',
+    'WARN-063': 'Contract cost is zero',
+    'WARN-064': 'Cost exceeds 50 billion PHP',
+    'WARN-065': 'Duplicate contract ID',
+    'WARN-066': 'Row number not found or invalid',
+    'WARN-067': 'Contract from more than 20 years ago',
+    'WARN-071': 'Unusually short description',
+    'WARN-072': 'Description truncated or incomplete',
+    'WARN-073': 'Unusually short contractor name',
+    'WARN-074': 'Field contains unusual characters',
+    'CRIT-051': 'No contract tbody found',
+    'CRIT-052': 'No tr element in tbody',
+    'CRIT-053': 'Span element not found for pattern',
+    'CRIT-054': 'HTML parsing failed',
+    'CRIT-055': 'HTML file is empty or unreadable',
+    'CRIT-091': 'HTML file not found',
+    'CRIT-092': 'File encoding error',
+    'CRIT-093': 'File permission denied',
+    'CRIT-094': 'Cannot extract year from filename',
+    'CRIT-095': 'No contracts found in file',
+}
+
+# ' (description)' suffix written after each code in the breakdowns
+CODE_SUFFIXES = {code: f" ({desc})" for code, desc in CODE_DESCRIPTIONS.items() if desc}
 
 
 def run_parser(year=None):
@@ -18,303 +124,212 @@ def run_parser(year=None):
         cmd.append(str(year))
     
     print(f"Running parser for year: {year if year else 'all years'}...")
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # The parser logs every file to stderr; only the tail is kept for the error report
+    with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True) as proc:
+        stderr_tail = deque(proc.stderr, maxlen=STDERR_TAIL_LINES)
     
-    if result.returncode != 0:
-        print(f"Error running parser: {result.stderr}")
+    if proc.returncode != 0:
+        print(f"Error running parser: {''.join(stderr_tail)}")
         return False
     
     return True
 
 
-def analyze_csv(csv_path):
-    """Analyze a CSV file and return statistics."""
-    stats = {
-        'total_contracts': 0,
-        'critical_errors': 0,
-        'errors': 0,
-        'warnings': 0,
-        'clean': 0,
-        'by_office': defaultdict(int),
-        'by_region': defaultdict(int),
-        'by_status': defaultdict(int),
-        'total_cost': 0.0,
-        'contracts_with_cost': 0,
-        'critical_error_types': defaultdict(int),
-        'error_types': defaultdict(int),
-        'warning_types': defaultdict(int),
-    }
-
-    def count_types(cell, dct):
-        if cell:
-            for note in cell.split('|'):
-                note = note.strip()
-                if note:
-                    code = note.split(':')[0].strip()
-                    dct[code] += 1
-
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            stats['total_contracts'] += 1
-
-            # Error tracking
-            if row.get('critical_errors'):
-                stats['critical_errors'] += 1
-                count_types(row.get('critical_errors'), stats['critical_error_types'])
-            if row.get('errors'):
-                stats['errors'] += 1
-                count_types(row.get('errors'), stats['error_types'])
-            if row.get('warnings'):
-                stats['warnings'] += 1
-                count_types(row.get('warnings'), stats['warning_types'])
-            if not any([row.get('critical_errors'), row.get('errors'), row.get('warnings')]):
-                stats['clean'] += 1
-
-            # Office/Region
-            source_office = row.get('source_office', 'Unknown')
-            stats['by_office'][source_office] += 1
-
-            region = row.get('region', 'Unknown')
-            stats['by_region'][region] += 1
-
-            # Status
-            status = row.get('status', 'Unknown')
-            stats['by_status'][status] += 1
-
-            # Cost
-            cost_str = row.get('cost_php', '')
-            if cost_str:
-                try:
-                    cost = float(cost_str)
-                    stats['total_cost'] += cost
-                    stats['contracts_with_cost'] += 1
-                except ValueError:
-                    pass
-
-    return stats
-
-
 def generate_summary_markdown(years_data, output_path):
     """Generate a markdown summary of all parsed data."""
-    lines = []
-    
-    lines.append("# DPWH Contracts Data Summary")
-    lines.append(f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("\n---\n")
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        _write_summary(f.write, years_data)
     
-    # Error code descriptions for breakdowns
-    code_desc = {
-        'ERR-001': 'Missing contract ID',
-        'ERR-002': 'Missing contract description',
-        'ERR-003': 'Missing contractor information',
-        'ERR-004': 'Missing implementing office',
-        'ERR-005': 'Missing source of funds',
-        'ERR-021': 'Invalid cost format',
-        'ERR-022': 'Negative cost value',
-        'ERR-023': 'Invalid percentage format',
-        'ERR-024': 'Percentage out of range',
-        'ERR-031': 'Invalid effectivity date format',
-        'ERR-032': 'Invalid expiry date format',
-        'ERR-033': 'Expiry date before effectivity date',
-        'ERR-042': 'Contractor missing ID code',
-        'ERR-044': 'Failed to parse contractor text',
-        'WARN-011': 'Empty cost field',
-        'WARN-012': 'Empty effectivity date',
-        'WARN-013': 'Empty expiry date',
-        'WARN-041': 'Multiple contractors found, stored in 4 columns (excess combined in column 4)',
-        'WARN-043': 'Contractor missing name, only ID found',
-        'WARN-061': 'Status/accomplishment mismatch',
-        'WARN-062': 'Status/expiry date mismatch',
-        'WARN-063': 'Contract cost is zero',
-        'WARN-064': 'Cost exceeds 50 billion PHP',
-        'WARN-065': 'Duplicate contract ID',
-        'WARN-066': 'Row number not found or invalid',
-        'WARN-067': 'Contract from more than 20 years ago',
-        'WARN-071': 'Unusually short description',
-        'WARN-072': 'Description truncated or incomplete',
-        'WARN-073': 'Unusually short contractor name',
-        'WARN-074': 'Field contains unusual characters',
-        'CRIT-051': 'No contract tbody found',
-        'CRIT-052': 'No tr element in tbody',
-        'CRIT-053': 'Span element not found for pattern',
-        'CRIT-054': 'HTML parsing failed',
-        'CRIT-055': 'HTML file is empty or unreadable',
-        'CRIT-091': 'HTML file not found',
-        'CRIT-092': 'File encoding error',
-        'CRIT-093': 'File permission denied',
-        'CRIT-094': 'Cannot extract year from filename',
-        'CRIT-095': 'No contracts found in file',
-    }
+    print(f"Summary written to: {output_path}")
+
+
+def _write_code_counts(write, counts):
+    """Write one '  - CODE (description): count' line per code, most frequent first."""
+    for code, count in sorted(counts.items(), key=itemgetter(1), reverse=True):
+        write(f"  - {code}{CODE_SUFFIXES.get(code, '')}: {count}\n")
+
+
+def _write_summary(write, years_data):
+    """Write the summary markdown line by line through write()."""
+    write("# DPWH Contracts Data Summary\n")
+    write(f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    write("\n---\n\n")
     
     # Overall summary
-    lines.append("## Overall Summary\n")
-    total_all = sum(data['total_contracts'] for data in years_data.values())
-    total_cost_all = sum(data['total_cost'] for data in years_data.values())
-    total_clean = sum(data['clean'] for data in years_data.values())
-    total_critical = sum(data['critical_errors'] for data in years_data.values())
-    total_errors = sum(data['errors'] for data in years_data.values())
-    total_warnings = sum(data['warnings'] for data in years_data.values())
-
-    # Aggregate status breakdown across all years
-    total_status = defaultdict(int)
-    for data in years_data.values():
-        for status, count in data['by_status'].items():
-            total_status[status] += count
-
-    # Aggregate error/warning types across all years
-    total_critical_types = defaultdict(int)
-    total_error_types = defaultdict(int)
-    total_warning_types = defaultdict(int)
+    write("## Overall Summary\n\n")
+    # Aggregate counts, status breakdown and error/warning types across all
+    # years in one pass
+    total_all = 0
+    total_cost_all = 0.0
+    total_clean = 0
+    total_critical = 0
+    total_errors = 0
+    total_warnings = 0
+    total_status = Counter()
+    total_critical_types = Counter()
+    total_error_types = Counter()
+    total_warning_types = Counter()
     for data in years_data.values():
-        for code, count in data['critical_error_types'].items():
-            total_critical_types[code] += count
-        for code, count in data['error_types'].items():
-            total_error_types[code] += count
-        for code, count in data['warning_types'].items():
-            total_warning_types[code] += count
-
-    lines.append(f"- **Total Contracts Parsed**: {total_all:,}")
-    lines.append(f"- **Total Contract Value**: ₱{total_cost_all:,.2f}")
-    lines.append(f"- **Years Covered**: {min(years_data.keys())} - {max(years_data.keys())}")
-    lines.append(f"- **Number of Years**: {len(years_data)}")
-    lines.append("")
+        total_all += data['total_contracts']
+        total_cost_all += data['total_cost']
+        total_clean += data['clean']
+        total_critical += data['critical_errors']
+        total_errors += data['errors']
+        total_warnings += data['warnings']
+        total_status.update(data['by_status'])
+        total_critical_types.update(data['critical_error_types'])
+        total_error_types.update(data['error_types'])
+        total_warning_types.update(data['warning_types'])
+
+    write(f"- **Total Contracts Parsed**: {total_all:,}\n")
+    write(f"- **Total Contract Value**: ₱{total_cost_all:,.2f}\n")
+    write(f"- **Years Covered**: {min(years_data.keys())} - {max(years_data.keys())}\n")
+    write(f"- **Number of Years**: {len(years_data)}\n")
+    write("\n")
 
     # Show total quality statistics
-    lines.append("**Total Data Quality (All Years):**")
-    lines.append(f"- Clean Contracts: {total_clean:,} ({total_clean/total_all*100:.1f}%)")
-    lines.append(f"- Contracts with Critical Errors: {total_critical:,}")
-    lines.append(f"- Contracts with Errors: {total_errors:,}")
-    lines.append(f"- Contracts with Warnings: {total_warnings:,}")
-    lines.append("")
+    write("**Total Data Quality (All Years):**\n")
+    write(f"- Clean Contracts: {total_clean:,} ({total_clean/total_all*100:.1f}%)\n")
+    write(f"- Contracts with Critical Errors: {total_critical:,}\n")
+    write(f"- Contracts with Errors: {total_errors:,}\n")
+    write(f"- Contracts with Warnings: {total_warnings:,}\n")
+    write("\n")
 
     # Show total status breakdown
-    lines.append("**Total Contract Status Breakdown (All Years):**")
-    for status, count in sorted(total_status.items(), key=lambda x: -x[1]):
+    write("**Total Contract Status Breakdown (All Years):**\n")
+    for status, count in sorted(total_status.items(), key=itemgetter(1), reverse=True):
         pct = count / total_all * 100 if total_all else 0
-        lines.append(f"- {status}: {count:,} ({pct:.1f}%)")
-    lines.append("")
+        write(f"- {status}: {count:,} ({pct:.1f}%)\n")
+    write("\n")
 
     # Show total error/warning breakdown
     if total_critical_types:
-        lines.append("**Total Critical Error Breakdown (All Years):**")
-        for code, count in sorted(total_critical_types.items(), key=lambda x: -x[1]):
-            desc = code_desc.get(code, "")
-            lines.append(f"  - {code}{' ('+desc+')' if desc else ''}: {count}")
-        lines.append("")
+        write("**Total Critical Error Breakdown (All Years):**\n")
+        _write_code_counts(write, total_critical_types)
+        write("\n")
     
     if total_error_types:
-        lines.append("**Total Error Breakdown (All Years):**")
-        for code, count in sorted(total_error_types.items(), key=lambda x: -x[1]):
-            desc = code_desc.get(code, "")
-            lines.append(f"  - {code}{' ('+desc+')' if desc else ''}: {count}")
-        lines.append("")
+        write("**Total Error Breakdown (All Years):**\n")
+        _write_code_counts(write, total_error_types)
+        write("\n")
     
     if total_warning_types:
-        lines.append("**Total Warning Breakdown (All Years):**")
-        for code, count in sorted(total_warning_types.items(), key=lambda x: -x[1]):
-            desc = code_desc.get(code, "")
-            lines.append(f"  - {code}{' ('+desc+')' if desc else ''}: {count}")
-        lines.append("")
+        write("**Total Warning Breakdown (All Years):**\n")
+        _write_code_counts(write, total_warning_types)
+        write("\n")
     
     # Per-year breakdown
-    lines.append("## Per-Year Breakdown\n")
+    write("## Per-Year Breakdown\n\n")
 
     for year in sorted(years_data.keys()):
         data = years_data[year]
-        lines.append(f"### {year}\n")
+        write(f"### {year}\n\n")
 
-        lines.append("**Contract Statistics:**")
-        lines.append(f"- Total Contracts: {data['total_contracts']:,}")
-        lines.append(f"- Clean Contracts: {data['clean']:,} ({data['clean']/data['total_contracts']*100:.1f}%)")
-        lines.append(f"- Contracts with Critical Errors: {data['critical_errors']:,}")
-        lines.append(f"- Contracts with Errors: {data['errors']:,}")
-        lines.append(f"- Contracts with Warnings: {data['warnings']:,}")
-        lines.append("")
+        write("**Contract Statistics:**\n")
+        write(f"- Total Contracts: {data['total_contracts']:,}\n")
+        write(f"- Clean Contracts: {data['clean']:,} ({data['clean']/data['total_contracts']*100:.1f}%)\n")
+        write(f"- Contracts with Critical Errors: {data['critical_errors']:,}\n")
+        write(f"- Contracts with Errors: {data['errors']:,}\n")
+        write(f"- Contracts with Warnings: {data['warnings']:,}\n")
+        write("\n")
 
         # Error/Warning breakdowns (with descriptions)
         if data['critical_error_types']:
-            lines.append("**Critical Error Breakdown:**")
-            for code, count in sorted(data['critical_error_types'].items(), key=lambda x: -x[1]):
-                desc = code_desc.get(code, "")
-                lines.append(f"  - {code}{' ('+desc+')' if desc else ''}: {count}")
-            lines.append("")
+            write("**Critical Error Breakdown:**\n")
+            _write_code_counts(write, data['critical_error_types'])
+            write("\n")
         if data['error_types']:
-            lines.append("**Error Breakdown:**")
-            for code, count in sorted(data['error_types'].items(), key=lambda x: -x[1]):
-                desc = code_desc.get(code, "")
-                lines.append(f"  - {code}{' ('+desc+')' if desc else ''}: {count}")
-            lines.append("")
+            write("**Error Breakdown:**\n")
+            _write_code_counts(write, data['error_types'])
+            write("\n")
         if data['warning_types']:
-            lines.append("**Warning Breakdown:**")
-            for code, count in sorted(data['warning_types'].items(), key=lambda x: -x[1]):
-                desc = code_desc.get(code, "")
-                lines.append(f"  - {code}{' ('+desc+')' if desc else ''}: {count}")
-            lines.append("")
+            write("**Warning Breakdown:**\n")
+            _write_code_counts(write, data['warning_types'])
+            write("\n")
 
-        lines.append("**Financial Statistics:**")
+        write("**Financial Statistics:**\n")
         if data['contracts_with_cost'] > 0:
             avg_cost = data['total_cost'] / data['contracts_with_cost']
-            lines.append(f"- Total Contract Value: ₱{data['total_cost']:,.2f}")
-            lines.append(f"- Contracts with Cost Data: {data['contracts_with_cost']:,} ({data['contracts_with_cost']/data['total_contracts']*100:.1f}%)")
-            lines.append(f"- Average Contract Value: ₱{avg_cost:,.2f}")
+            write(f"- Total Contract Value: ₱{data['total_cost']:,.2f}\n")
+            write(f"- Contracts with Cost Data: {data['contracts_with_cost']:,} ({data['contracts_with_cost']/data['total_contracts']*100:.1f}%)\n")
+            write(f"- Average Contract Value: ₱{avg_cost:,.2f}\n")
         else:
-            lines.append("- No cost data available")
-        lines.append("")
+            write("- No cost data available\n")
+        write("\n")
 
-        lines.append("**By Source Office:**")
-        for office, count in sorted(data['by_office'].items(), key=lambda x: x[1], reverse=True)[:10]:
+        write("**By Source Office:**\n")
+        for office, count in data['by_office'].most_common(10):
             pct = count / data['total_contracts'] * 100
-            lines.append(f"- {office}: {count:,} ({pct:.1f}%)")
+            write(f"- {office}: {count:,} ({pct:.1f}%)\n")
         if len(data['by_office']) > 10:
-            lines.append(f"- ... and {len(data['by_office']) - 10} more offices")
-        lines.append("")
+            write(f"- ... and {len(data['by_office']) - 10} more offices\n")
+        write("\n")
 
-        lines.append("**By Contract Status:**")
-        for status, count in sorted(data['by_status'].items(), key=lambda x: x[1], reverse=True):
+        write("**By Contract Status:**\n")
+        for status, count in sorted(data['by_status'].items(), key=itemgetter(1), reverse=True):
             pct = count / data['total_contracts'] * 100
-            lines.append(f"- {status}: {count:,} ({pct:.1f}%)")
-        lines.append("")
+            write(f"- {status}: {count:,} ({pct:.1f}%)\n")
+        write("\n")
 
-        lines.append("---\n")
-    
-    # Write to file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(lines))
-    
-    print(f"Summary written to: {output_path}")
+        write("---\n\n")
 
 
-def main():
-    """Main function to parse all data and generate summaries."""
+def main(force=False, use_cache=True):
+    """Main function to parse all data and generate summaries.
+    
+    A year's parser run is skipped when its CSV is newer than every HTML file
+    for that year, unless force is set. The parser only moves a CSV into place
+    once every file has been parsed, so an existing CSV is always a complete
+    run and a failed or interrupted run never passes this check. A year's CSV analysis is reused from
+    CACHE_DIR while the CSV is unchanged, unless use_cache is False.
+    """
     csv_dir = Path('csv')
     years = range(2016, 2026)  # 2016-2025
+    html_mtimes = latest_html_mtimes()
     
     years_data = {}
+    csv_paths = {}
     
-    # Parse each year
+    # Parse each year (one parser run at a time: each run already spreads
+    # its HTML files over all cores)
     for year in years:
         print(f"\n{'='*60}")
         print(f"Processing Year: {year}")
         print('='*60)
         
-        # Run parser
-        if not run_parser(year):
+        # Run parser, unless the CSV is already up to date (it is published
+        # atomically, so a newer CSV is never a partial one)
+        csv_path = csv_dir / f'contracts_{year}_all_offices.csv'
+        if not force and csv_path.exists() and csv_path.stat().st_mtime >= html_mtimes[year]:
+            print(f"CSV up to date, skipping parser: {csv_path}")
+        elif not run_parser(year):
             print(f"Failed to parse {year}, skipping...")
             continue
         
         # Find the CSV file
-        csv_path = csv_dir / f'contracts_{year}_all_offices.csv'
         if not csv_path.exists():
             print(f"CSV not found: {csv_path}")
             continue
         
-        # Analyze CSV
-        print(f"Analyzing {csv_path}...")
-        stats = analyze_csv(csv_path)
-        years_data[year] = stats
-        
-        print(f"✓ {year}: {stats['total_contracts']:,} contracts, {stats['clean']:,} clean")
+        stats = load_cached_stats(year, csv_path) if use_cache else None
+        if stats is not None:
+            years_data[year] = stats
+            print(f"✓ {year}: {stats['total_contracts']:,} contracts, {stats['clean']:,} clean (cached)")
+        else:
+            csv_paths[year] = csv_path
+    
+    # Analyze the CSVs; they are independent, so each year gets its own process
+    if csv_paths:
+        print(f"\nAnalyzing {len(csv_paths)} CSV file(s)...")
+        # This summary lists the error and warning codes, so they are counted too
+        analyze = partial(analyze_csv, count_codes=True)
+        with ProcessPoolExecutor() as executor:
+            for year, stats in zip(csv_paths, executor.map(analyze, csv_paths.values())):
+                years_data[year] = stats
+                save_cached_stats(year, csv_paths[year], stats)
+                print(f"✓ {year}: {stats['total_contracts']:,} contracts, {stats['clean']:,} clean")
+        # Back in year order: the all-years breakdowns list tied counts in first-seen order
+        years_data = dict(sorted(years_data.items()))
     
     # Generate summary
     if years_data:
@@ -329,4 +344,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    main(force='--force' in sys.argv[1:], use_cache='--no-cache' not in sys.argv[1:])
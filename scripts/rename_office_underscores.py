@@ -3,21 +3,27 @@
 Rename DPWH HTML files: convert underscores in office names to dashes.
 Example: table_Central_Office_2016_20251111_155202.html -> table_Central-Office_2016_20251111_155202.html
 """
+import os
 import re
-from pathlib import Path
+
+FILENAME_PATTERN = re.compile(r'^(table_)(.+?)(_20\d{2}_\d{8}_\d{6}\.html)$')
+
 
 def rename_html_files(directory='html'):
-    pattern = re.compile(r'^(table_)(.+?)(_20\d{2}_\d{8}_\d{6}\.html)$')
-    html_dir = Path(directory)
-    for file in html_dir.glob('table_*.html'):
-        match = pattern.match(file.name)
+    # Names are listed up front so renamed entries are not picked up again mid-scan
+    with os.scandir(directory) as entries:
+        names = [entry.name for entry in entries]
+    for name in names:
+        if not (name.startswith('table_') and name.endswith('.html')):
+            continue
+        match = FILENAME_PATTERN.match(name)
         if match:
             prefix, office, suffix = match.groups()
-            new_office = office.replace('_', '-')
-            new_name = f"{prefix}{new_office}{suffix}"
-            new_path = file.with_name(new_name)
-            print(f"Renaming: {file.name} -> {new_name}")
-            file.rename(new_path)
+            new_name = f"{prefix}{office.replace('_', '-')}{suffix}"
+            if new_name == name:
+                continue
+            print(f"Renaming: {name} -> {new_name}")
+            os.rename(os.path.join(directory, name), os.path.join(directory, new_name))
 
 if __name__ == '__main__':
     rename_html_files()
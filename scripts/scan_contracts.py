@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Single-pass scanner for contracts CSV files.
+Aggregates per-year statistics and extracts rows with warnings in one read.
+"""
+
+import csv
+from pathlib import Path
+from collections import Counter, defaultdict
+from contextlib import nullcontext
+from functools import reduce
+from itertools import compress, groupby, islice
+from operator import add, itemgetter
+from sys import intern
+
+
+# Columns read per row, in the order returned by _summary_getter()
+SUMMARY_FIELDS = (
+    'critical_errors', 'errors', 'warnings',
+    'source_office', 'region', 'status', 'cost_php',
+)
+
+# Rows aggregated per column-wise batch
+BATCH_SIZE = 10000
+
+# Read buffer for the input CSVs (1 MiB)
+READ_BUFFER_SIZE = 1 << 20
+
+# First non-space characters float() can accept besides Unicode decimal
+# digits: a sign, a point, or the start of 'inf'/'infinity'/'nan'
+_NUMBER_START = frozenset('+-.0123456789iInN')
+
+# Label counted for an empty office, region or status cell
+UNKNOWN = intern('Unknown')
+
+
+def _new_stats():
+    """Return an empty statistics dict."""
+    return {
+        'total_contracts': 0,
+        'critical_errors': 0,
+        'errors': 0,
+        'warnings': 0,
+        'clean': 0,
+        'by_office': Counter(),
+        'by_region': Counter(),
+        'by_status': Counter(),
+        'total_cost': 0.0,
+        'contracts_with_cost': 0,
+        'critical_error_types': Counter(),
+        'error_types': Counter(),
+        'warning_types': Counter(),
+    }
+
+
+def _summary_getter(header):
+    """Build an itemgetter that pulls SUMMARY_FIELDS out of a csv.reader row."""
+    return itemgetter(*(header.index(name) for name in SUMMARY_FIELDS))
+
+
+def _full_rows(reader, width):
+    """Yield csv.reader rows, padding short rows with empty cells.
+    
+    Blank lines come through as empty rows and are skipped, as DictReader does.
+    """
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            row += [''] * (width - len(row))
+        yield row
+
+
+def _batches(rows, size=BATCH_SIZE):
+    """Split an iterable of rows into lists of at most size rows."""
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _parse_costs(cost_cells):
+    """Convert non-empty cost cells to floats, dropping malformed values.
+    
+    A cell is kept exactly when float() accepts it, whether or not the
+    rest of its batch is clean:
+    
+    >>> _parse_costs(['1', 'nan', ' 2', 'inf', ''])
+    [1.0, nan, 2.0, inf]
+    >>> _parse_costs(['1', 'nan', ' 2', 'inf', '', 'x'])
+    [1.0, nan, 2.0, inf]
+    """
+    present = list(filter(None, cost_cells))
+    try:
+        return list(map(float, present))
+    except ValueError:
+        # Slow path for a batch with malformed cells: screen out text that
+        # cannot be a number before paying for a raised ValueError
+        values = []
+        for cell in present:
+            first = cell.lstrip()[:1]
+            if first not in _NUMBER_START and not first.isdecimal():
+                continue
+            try:
+                values.append(float(cell))
+            except ValueError:
+                pass
+        return values
+
+
+def _labels(cells):
+    """Intern category cells so counter lookups hit on identity; empty cells become UNKNOWN."""
+    return [intern(cell) if cell else UNKNOWN for cell in cells]
+
+
+def _count_codes(counter, cells):
+    """Count the note codes ('CODE: message | ...') in a column of note cells."""
+    counter.update(
+        note.partition(':')[0].strip()
+        for cell in cells if cell
+        for note in map(str.strip, cell.split('|')) if note
+    )
+
+
+def _aggregate(stats, rows, count_codes=False):
+    """Fold a batch of SUMMARY_FIELDS tuples into stats, one column at a time.
+    
+    The per-code Counters (critical_error_types, error_types, warning_types)
+    are only filled when count_codes is set.
+    """
+    crit, err, warn, offices, regions, statuses, costs = zip(*rows)
+    total = len(crit)
+    
+    stats['total_contracts'] += total
+    
+    # Error tracking
+    stats['critical_errors'] += total - crit.count('')
+    stats['errors'] += total - err.count('')
+    stats['warnings'] += total - warn.count('')
+    stats['clean'] += total - sum(map(any, zip(crit, err, warn)))
+    if count_codes:
+        _count_codes(stats['critical_error_types'], crit)
+        _count_codes(stats['error_types'], err)
+        _count_codes(stats['warning_types'], warn)
+    
+    # Office/Region/Status
+    stats['by_office'].update(_labels(offices))
+    stats['by_region'].update(_labels(regions))
+    stats['by_status'].update(_labels(statuses))
+    
+    # Cost
+    values = _parse_costs(costs)
+    stats['total_cost'] = reduce(add, values, stats['total_cost'])
+    stats['contracts_with_cost'] += len(values)
+
+
+def analyze_csv(csv_path, count_codes=False):
+    """Analyze a CSV file and return statistics.
+    
+    With count_codes set, the error and warning codes are counted as well.
+    """
+    stats = _new_stats()
+    
+    with open(csv_path, 'r', newline='', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return stats
+        get_fields = _summary_getter(header)
+        rows = map(get_fields, _full_rows(reader, len(header)))
+        for batch in _batches(rows):
+            _aggregate(stats, batch, count_codes)
+    
+    return stats
+
+
+def scan_contracts(csv_path, warnings_path=None, collect_stats=True):
+    """Analyze CSV grouped by year, optionally writing rows with warnings.
+    
+    Args:
+        csv_path: Path to the contracts CSV
+        warnings_path: If given, rows with non-empty warnings are copied here
+        collect_stats: If False, per-year statistics are skipped and only the
+            warnings rows are written
+    
+    Returns:
+        Tuple of (stats by year, number of rows with warnings written).
+        An input without a header row returns ({}, 0) before warnings_path
+        is created.
+    """
+    by_year = defaultdict(_new_stats)
+    warnings_count = 0
+    
+    with open(csv_path, 'r', newline='', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return {}, warnings_count
+        get_year = itemgetter(header.index('year'))
+        get_warnings = itemgetter(header.index('warnings'))
+        get_fields = _summary_getter(header)
+        
+        rows = _full_rows(reader, len(header))
+        if collect_stats:
+            # Rows are written year by year, so each run of equal years is
+            # converted and aggregated as a block rather than row by row
+            runs = groupby(rows, key=get_year)
+        else:
+            runs = [(None, rows)]
+        
+        if warnings_path is not None:
+            output = open(warnings_path, 'w', newline='', encoding='utf-8')
+        else:
+            output = nullcontext()
+        
+        with output as outfile:
+            writer = None
+            if outfile is not None:
+                writer = csv.writer(outfile)
+                writer.writerow(header)
+            
+            for year_str, run in runs:
+                stats = None
+                if collect_stats:
+                    try:
+                        stats = by_year[int(year_str)]
+                    except ValueError:
+                        pass
+                
+                for batch in _batches(run):
+                    if writer is not None:
+                        flagged = list(compress(batch, map(str.strip, map(get_warnings, batch))))
+                        writer.writerows(flagged)
+                        warnings_count += len(flagged)
+                    if stats is not None:
+                        _aggregate(stats, map(get_fields, batch))
+    
+    return dict(by_year), warnings_count
+
+
+def analyze_year_from_all_csv(csv_path):
+    """Analyze CSV and group by year."""
+    years_data, _ = scan_contracts(csv_path)
+    return years_data
+
+
+def main():
+    """Scan the combined CSV once for both the warnings extract and the summary."""
+    from generate_summary import generate_summary_markdown
+    
+    all_csv = Path('csv/contracts_all_years_all_offices.csv')
+    warnings_csv = Path('csv/contracts_with_warnings.csv')
+    summary_path = Path('docs/parsing_summary.md')
+    
+    print(f"Scanning {all_csv}...")
+    years_data, warnings_count = scan_contracts(all_csv, warnings_csv)
+    print(f"Extracted {warnings_count} contracts with warnings to {warnings_csv}")
+    
+    if years_data:
+        print(f"\nGenerating summary for {len(years_data)} years...")
+        generate_summary_markdown(years_data, summary_path)
+    else:
+        print("\n✗ No contracts found to summarize!")
+
+
+if __name__ == '__main__':
+    main()
@@ -20,19 +20,18 @@ Features:
 Output:
 -------
 - HTML files: table_{Region}_{Year}_{Timestamp}.html
-- JSON index: scrape_index_{Timestamp}.json
+- JSON Lines index: scrape_index_{Timestamp}.jsonl (one line per saved table)
 
 Total Expected Files: 180 HTML files (18 regions × 10 years) + 1 JSON index
 
 Dependencies:
 -------------
 - playwright (with chromium browser installed)
-- beautifulsoup4
 - Python 3.7+
 
 Installation:
 -------------
-pip install playwright beautifulsoup4
+pip install playwright
 playwright install chromium
 
 Usage:
@@ -43,7 +42,7 @@ Notes:
 ------
 1. First region requires MANUAL selection to avoid Imperva blocking
 2. Browser runs in visible mode (headless=False) for monitoring
-3. Each table is saved immediately after extraction
+3. Each table is saved, and added to the index, immediately after extraction
 4. ASP.NET postbacks are handled with appropriate wait times
 5. Random delays simulate human behavior
 
@@ -56,12 +55,49 @@ import time
 import json
 import random
 import os
+from collections import Counter, defaultdict
 from datetime import datetime
-from bs4 import BeautifulSoup
 
 BASE_URL = "http://apps2.dpwh.gov.ph/infra_projects/"
 OUTPUT_DIR = "output"
 
+# Set SCRAPER_VERBOSE=1 to log every random delay
+VERBOSE = os.environ.get('SCRAPER_VERBOSE') == '1'
+
+# Cookies and local storage saved once the first region has been selected by
+# hand, so a later run starts with the Imperva/Incapsula session already set
+STORAGE_STATE_PATH = os.path.join(".cache", "scraper_storage_state.json")
+
+# Start of every project ID span in a table's outerHTML (the browser always
+# serializes attributes with double quotes)
+PROJECT_ID_MARKER = 'id="Repeater1_lblCustomerId_'
+
+# HTTP statuses Imperva answers with when it blocks or rate-limits a client
+BLOCKED_STATUSES = frozenset((403, 429))
+
+# Fallback block check, run in the browser. Challenge pages are small and
+# name Incapsula/Imperva near the top, so only the first 4 KB is scanned
+IMPERVA_CHECK_JS = """() => {
+    const head = document.documentElement.outerHTML.slice(0, 4096).toLowerCase();
+    return head.includes('incapsula') || head.includes('imperva');
+}"""
+
+# Postback sentinel: the current results table is tagged before a dropdown
+# change, and the wait is over once the document is parsed and holds an
+# untagged table (works whether the postback reloads the page or not)
+RESULTS_TABLE_SELECTOR = 'table.table-bordered, table.caption-top'
+MARK_STALE_TABLE_JS = f"""() => document.querySelectorAll('{RESULTS_TABLE_SELECTOR}')
+    .forEach(table => table.dataset.scraperStale = '1')"""
+NEW_TABLE_READY_JS = f"""() => {{
+    if (document.readyState === 'loading') return false;
+    const table = document.querySelector('{RESULTS_TABLE_SELECTOR}');
+    return table !== null && !table.dataset.scraperStale;
+}}"""
+
+# Subresources the scraper never needs; scripts and documents still load
+# because the Imperva challenge and __doPostBack both run JavaScript
+BLOCKED_RESOURCE_TYPES = frozenset(('image', 'font', 'stylesheet', 'media'))
+
 # Create output directory if it doesn't exist
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
@@ -81,13 +117,47 @@ def random_delay(min_sec=1.5, max_sec=3.5):
         None
     
     Side Effects:
-        - Prints the actual delay duration
+        - Prints the actual delay duration when SCRAPER_VERBOSE=1
         - Pauses execution for the random duration
     """
     delay = random.uniform(min_sec, max_sec)
-    print(f"    [Delay: {delay:.1f}s]")
+    if VERBOSE:
+        print(f"    [Delay: {delay:.1f}s]")
     time.sleep(delay)
 
+def block_heavy_resources(route):
+    """
+    Route handler that drops subresources the scraper does not need.
+    
+    Registered with context.route() so images, fonts, stylesheets and media
+    are aborted before they are downloaded; every other request continues.
+    
+    Args:
+        route: Playwright Route object for the intercepted request
+    
+    Returns:
+        None
+    """
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+def is_postback_response(response):
+    """
+    Check whether a response answers an ASP.NET dropdown postback.
+    
+    Used with page.expect_response() so a dropdown change is waited on until
+    the server has actually answered it, rather than for a fixed delay.
+    
+    Args:
+        response (playwright.sync_api.Response): Response seen by the page
+    
+    Returns:
+        bool: True for a POST back to the infra_projects page
+    """
+    return response.request.method == 'POST' and 'infra_projects' in response.url
+
 # All Philippine regions covered by DPWH
 REGIONS = [
     "Central Office",                      # National projects coordination
@@ -120,9 +190,9 @@ def extract_table_html(page):
     """
     Extract the complete HTML table element from the current page.
     
-    This function retrieves the entire page HTML, parses it with BeautifulSoup,
-    and extracts the main data table without parsing individual rows. The raw
-    HTML is returned for later processing by a separate parser.
+    This function locates the main data table in the live page and returns its
+    outerHTML straight from the browser, without parsing individual rows. The
+    raw HTML is returned for later processing by a separate parser.
     
     Args:
         page (playwright.sync_api.Page): Active Playwright page object
@@ -131,12 +201,11 @@ def extract_table_html(page):
         str: Complete HTML table as string, or None if extraction fails
     
     Process:
-        1. Fetch full page HTML content
-        2. Check for anti-bot blocking (Imperva/Incapsula)
-        3. Parse with BeautifulSoup
-        4. Find table by class 'table-bordered'
-        5. Count projects (Repeater1_lblCustomerId_* spans)
-        6. Return raw table HTML
+        1. Check for anti-bot blocking (Imperva/Incapsula) in the browser
+        2. Locate table by class 'table-bordered' (fallback: 'caption-top')
+        3. Take the table's outerHTML
+        4. Count projects (Repeater1_lblCustomerId_* spans)
+        5. Return raw table HTML
     
     Table Structure:
         - ASP.NET Repeater control with IDs like:
@@ -152,41 +221,35 @@ def extract_table_html(page):
           * Repeater1_Label1_{n} - Accomplishment %
     
     Anti-Bot Detection:
-        - Checks for 'incapsula' or 'imperva' strings in HTML
+        - Blocked postbacks (HTTP 403/429) are caught by the callers
+        - Checks for 'incapsula' or 'imperva' in the first 4 KB of the page
         - Returns None if blocking detected
     """
     try:
-        # Get the entire page HTML
-        print("    📄 Getting full page HTML...")
-        html_content = page.content()
-        print(f"    📄 HTML length: {len(html_content)} characters")
-        
         # Check for Imperva/Incapsula blocking first
-        if 'incapsula' in html_content.lower() or 'imperva' in html_content.lower():
+        if page.evaluate(IMPERVA_CHECK_JS):
             print("    ⚠️  BLOCKED: Imperva/Incapsula detected!")
             return None
         
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
         # Find the table element (it has multiple classes, so just look for table with "table-bordered")
-        table = soup.find('table', class_='table-bordered')
+        table = page.locator('table.table-bordered').first
         
-        if not table:
+        if not table.count():
             print("    ✗ No table found")
             # Try alternative: find any table with caption-top
-            table = soup.find('table', class_='caption-top')
-            if not table:
+            table = page.locator('table.caption-top').first
+            if not table.count():
                 print("    ✗ No table with caption-top found either")
                 return None
         
-        # Convert table to string
-        table_html = str(table)
+        # Only the table's markup crosses over from the browser, not the whole page
+        table_html = table.evaluate('el => el.outerHTML')
         print(f"    ✓ Table HTML extracted: {len(table_html)} characters")
         
-        # Quick check for projects
-        project_spans = table.find_all('span', id=lambda x: x and x.startswith('Repeater1_lblCustomerId_'))
-        print(f"    ℹ️  Table contains {len(project_spans)} project(s)")
+        # Quick check for projects, counted in the HTML already in hand rather
+        # than with another query to the browser
+        project_count = table_html.count(PROJECT_ID_MARKER)
+        print(f"    ℹ️  Table contains {project_count} project(s)")
         
         return table_html
     
@@ -196,7 +259,7 @@ def extract_table_html(page):
         traceback.print_exc()
         return None
 
-def scrape_year(page, region, year, is_first_year=False):
+def scrape_year(page, region, region_slug, year, is_first_year=False):
     """
     Scrape infrastructure project data for a specific year within a region.
     
@@ -206,6 +269,7 @@ def scrape_year(page, region, year, is_first_year=False):
     Args:
         page (playwright.sync_api.Page): Active Playwright page object
         region (str): Name of the Philippine region being scraped
+        region_slug (str): Region name as used in file names (e.g., "Region-I")
         year (str): Year to scrape (e.g., "2025")
         is_first_year (bool): If True, skip year selection (use current state)
     
@@ -224,12 +288,12 @@ def scrape_year(page, region, year, is_first_year=False):
     
     ASP.NET Behavior:
         - Selecting a year triggers a postback (page reload)
-        - Must wait for 'networkidle' state before extraction
+        - Must wait for the new results table before extraction
         - First year uses current page state (already loaded)
     
     Process Flow:
         1. Select year from dropdown (if not first)
-        2. Wait for ASP.NET postback (2-4s + networkidle)
+        2. Wait for the ASP.NET postback response, then its rendered table
         3. Extract table HTML
         4. Save immediately to file
         5. Return metadata
@@ -245,19 +309,24 @@ def scrape_year(page, region, year, is_first_year=False):
             year_dropdown.scroll_into_view_if_needed()
             random_delay(0.3, 0.7)
             
-            # Select year option
-            page.select_option('#ddlYear', value=year)
+            # Select year option; the wait ends as soon as the postback is answered
             print("       ⏳ Waiting for ASP.NET postback...")
+            page.evaluate(MARK_STALE_TABLE_JS)
+            with page.expect_response(is_postback_response, timeout=15000) as postback:
+                page.select_option('#ddlYear', value=year)
             
-            # Wait for page to reload after year selection
-            random_delay(2, 4)
-            page.wait_for_load_state('networkidle', timeout=15000)
+            # A block shows up in the postback's status; no table will follow
+            if postback.value.status in BLOCKED_STATUSES:
+                print(f"       ⚠️  BLOCKED: postback answered with HTTP {postback.value.status}")
+                return None
+            
+            # Wait for the new table rather than for the network to go idle
+            page.wait_for_function(NEW_TABLE_READY_JS, timeout=15000)
             print("       ✓ Postback complete")
-            random_delay(1, 2)
         else:
             print(f"    ℹ️  First year - using current page state")
         
-        # Extract table HTML
+        # Extract table HTML; this one delay also settles the page after a postback
         print("    2️⃣  Extracting table HTML...")
         random_delay(1, 2)
         table_html = extract_table_html(page)
@@ -266,9 +335,9 @@ def scrape_year(page, region, year, is_first_year=False):
             print(f"    ✅ Table HTML extracted successfully")
             
             # Save immediately
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            region_name = region.replace(' ', '-').replace('_', '-')
-            html_file = f'table_{region_name}_{year}_{timestamp}.html'
+            extracted_at = datetime.now()
+            timestamp = extracted_at.strftime("%Y%m%d_%H%M%S")
+            html_file = f'table_{region_slug}_{year}_{timestamp}.html'
             html_path = os.path.join(OUTPUT_DIR, html_file)
             
             with open(html_path, 'w', encoding='utf-8') as f:
@@ -282,7 +351,7 @@ def scrape_year(page, region, year, is_first_year=False):
                 'html_file': html_file,
                 'html_path': html_path,
                 'html_size': len(table_html),
-                'extracted_at': datetime.now().isoformat()
+                'extracted_at': extracted_at.isoformat()
             }
         else:
             print(f"    ⚠️  No table HTML extracted")
@@ -294,7 +363,20 @@ def scrape_year(page, region, year, is_first_year=False):
         traceback.print_exc()
         return None
 
-def scrape_region(page, region, is_first_region=False):
+def append_to_index(index_file, result):
+    """
+    Append one scraped table's metadata to the JSON Lines index.
+    
+    Each line is written as soon as its table is saved, so the index survives
+    a crash or Ctrl+C part-way through a run.
+    
+    Args:
+        index_file (file): Index opened in text mode by main()
+        result (dict): Metadata returned by scrape_year()
+    """
+    index_file.write(json.dumps(result, ensure_ascii=False) + '\n')
+
+def scrape_region(page, region, is_first_region=False, index_file=None):
     """
     Scrape all years (2016-2025) of infrastructure project data for one region.
     
@@ -306,6 +388,8 @@ def scrape_region(page, region, is_first_region=False):
         page (playwright.sync_api.Page): Active Playwright page object
         region (str): Name of the Philippine region to scrape
         is_first_region (bool): If True, prompts user for manual selection
+        index_file (file): If given, each year's metadata is appended to it
+                           as soon as the year is saved
     
     Returns:
         list: List of metadata dictionaries (one per year successfully scraped)
@@ -323,7 +407,7 @@ def scrape_region(page, region, is_first_region=False):
     Subsequent Regions:
         - Automated dropdown selection
         - Simulated human-like mouse movements and delays
-        - ASP.NET postback handling (3-5s + networkidle wait)
+        - ASP.NET postback handling (postback response + rendered table wait)
     
     Year Iteration:
         - Loops through all years in YEARS list (2016-2025)
@@ -363,6 +447,10 @@ def scrape_region(page, region, is_first_region=False):
             random_delay(2, 4)
             page.wait_for_load_state('networkidle', timeout=30000)
             
+            # The session has passed the bot check by now; keep it for next time
+            os.makedirs(os.path.dirname(STORAGE_STATE_PATH), exist_ok=True)
+            page.context.storage_state(path=STORAGE_STATE_PATH)
+            
         else:
             # Subsequent regions: automate
             print(f"  1️⃣  Selecting region: {region}")
@@ -377,24 +465,31 @@ def scrape_region(page, region, is_first_region=False):
             random_delay(0.5, 1)
             
             print(f"     ✓ Selecting: {region}")
-            page.select_option('#ddlRegion', label=region)
             print("     ⏳ Waiting for ASP.NET postback...")
+            page.evaluate(MARK_STALE_TABLE_JS)
+            with page.expect_response(is_postback_response, timeout=15000) as postback:
+                page.select_option('#ddlRegion', label=region)
             
-            # Wait for region change postback
-            random_delay(3, 5)
-            page.wait_for_load_state('networkidle', timeout=15000)
+            if postback.value.status in BLOCKED_STATUSES:
+                print(f"     ⚠️  BLOCKED: postback answered with HTTP {postback.value.status}")
+                return region_results
+            
+            # Wait for region change postback to render its table
+            page.wait_for_function(NEW_TABLE_READY_JS, timeout=15000)
             print("     ✓ Postback complete")
-            random_delay(2, 3)
         
         # Now scrape all years for this region
         print(f"\n  🗓️  Scraping all years for {region}...")
+        region_slug = region.replace(' ', '-').replace('_', '-')
         
         for year_idx, year in enumerate(YEARS):
             is_first_year = (year_idx == 0)
-            result = scrape_year(page, region, year, is_first_year=is_first_year)
+            result = scrape_year(page, region, region_slug, year, is_first_year=is_first_year)
             
             if result:
                 region_results.append(result)
+                if index_file is not None:
+                    append_to_index(index_file, result)
                 print(f"    ✓ Completed: {year}")
             else:
                 print(f"    ⚠️  Failed: {year}")
@@ -421,7 +516,7 @@ def main():
     2. Page navigation and initial load
     3. Sequential scraping of all 18 regions
     4. Each region scraped for all 10 years (2016-2025)
-    5. Summary statistics and JSON index generation
+    5. Summary statistics (the index is written as tables are saved)
     
     Browser Configuration:
         - Chromium engine (most reliable for ASP.NET sites)
@@ -443,23 +538,15 @@ def main():
               - Extract and save table HTML
            c. Move to next region
         4. Generate summary statistics
-        5. Save JSON index file
+        5. Report where the index was written
     
     Output Files:
         - 180 HTML files: table_{Region}_{Year}_{Timestamp}.html
-        - 1 JSON index: scrape_index_{Timestamp}.json
-    
-    JSON Index Structure:
-        [
-            {
-                "region": "Region I",
-                "year": "2025",
-                "html_file": "table_Region_I_2025_20251111_143022.html",
-                "html_size": 1234567,
-                "extracted_at": "2025-11-11T14:30:22.123456"
-            },
-            ...
-        ]
+        - 1 JSON Lines index: scrape_index_{Timestamp}.jsonl
+    
+    JSON Lines Index Structure (one object per line, appended per saved table):
+        {"region": "Region I", "year": "2025", "html_file": "table_Region_I_2025_20251111_143022.html", "html_size": 1234567, "extracted_at": "2025-11-11T14:30:22.123456"}
+        ...
     
     User Interaction:
         - Initial: Press Enter to start
@@ -490,6 +577,9 @@ def main():
     
     all_projects = []
     
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    index_path = os.path.join(OUTPUT_DIR, f'scrape_index_{timestamp}.jsonl')
+    
     with sync_playwright() as p:
         # Launch browser with visible window and anti-detection
         print("\nLaunching browser...")
@@ -503,6 +593,11 @@ def main():
             ]
         )
         
+        # Reuse the session saved by an earlier run, if there is one
+        storage_state = STORAGE_STATE_PATH if os.path.exists(STORAGE_STATE_PATH) else None
+        if storage_state:
+            print(f"Reusing saved session: {storage_state}")
+        
         # Create context with realistic settings
         context = browser.new_context(
             viewport={'width': 1920, 'height': 1080},
@@ -511,6 +606,7 @@ def main():
             timezone_id='Asia/Manila',
             permissions=['geolocation'],
             color_scheme='light',
+            storage_state=storage_state,
         )
         
         # Remove webdriver property
@@ -520,6 +616,9 @@ def main():
             });
         """)
         
+        # Only the table HTML is needed, so skip the page's heavy subresources
+        context.route('**/*', block_heavy_resources)
+        
         page = context.new_page()
         
         try:
@@ -530,23 +629,27 @@ def main():
             page.wait_for_load_state('networkidle', timeout=30000)
             print("✓ Initial page loaded\n")
             
-            for idx, region in enumerate(REGIONS):
-                is_first_region = (idx == 0)
-                region_results = scrape_region(page, region, is_first_region=is_first_region)
-                
-                if region_results:
-                    all_projects.extend(region_results)
-                    print(f"\n  ✅ Completed {region}: {len(region_results)} years scraped")
-                else:
-                    print(f"\n  ⚠️  No data for region: {region}")
-                
-                # Show progress
-                print(f"\n  📊 Total files collected: {len(all_projects)}")
-                
-                # Random delay between regions
-                if idx < len(REGIONS) - 1:
-                    print(f"\n  💤 Waiting before next region...")
-                    random_delay(3, 6)
+            # Index lines are appended as each table is saved (line-buffered,
+            # so every line is on disk before the next postback)
+            with open(index_path, 'a', encoding='utf-8', buffering=1) as index_file:
+                for idx, region in enumerate(REGIONS):
+                    is_first_region = (idx == 0)
+                    region_results = scrape_region(page, region, is_first_region=is_first_region,
+                                                   index_file=index_file)
+                    
+                    if region_results:
+                        all_projects.extend(region_results)
+                        print(f"\n  ✅ Completed {region}: {len(region_results)} years scraped")
+                    else:
+                        print(f"\n  ⚠️  No data for region: {region}")
+                    
+                    # Show progress
+                    print(f"\n  📊 Total files collected: {len(all_projects)}")
+                    
+                    # Random delay between regions
+                    if idx < len(REGIONS) - 1:
+                        print(f"\n  💤 Waiting before next region...")
+                        random_delay(3, 6)
             
             # Show summary
             print("\n" + "="*70)
@@ -554,28 +657,21 @@ def main():
             print("="*70)
             print(f"Total files scraped: {len(all_projects)}")
             
-            # Group by region
+            # Group by region: years and total HTML size in one pass
             if all_projects:
-                from collections import defaultdict
-                by_region = defaultdict(list)
+                years_by_region = defaultdict(list)
+                size_by_region = Counter()
                 for item in all_projects:
-                    by_region[item['region']].append(item)
+                    years_by_region[item['region']].append(item['year'])
+                    size_by_region[item['region']] += item['html_size']
                 
-                print(f"\nRegions collected: {len(by_region)}")
-                for region_name, items in by_region.items():
-                    total_size = sum(item['html_size'] for item in items) / 1024  # KB
-                    years = [item['year'] for item in items]
-                    print(f"  • {region_name}: {len(items)} years ({', '.join(years)}) - {total_size:.1f} KB total")
+                print(f"\nRegions collected: {len(years_by_region)}")
+                for region_name, years in years_by_region.items():
+                    total_size = size_by_region[region_name] / 1024  # KB
+                    print(f"  • {region_name}: {len(years)} years ({', '.join(years)}) - {total_size:.1f} KB total")
             
-            # Save JSON index with metadata
+            # The index was written as the tables were saved
             if all_projects:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                index_file = f'scrape_index_{timestamp}.json'
-                index_path = os.path.join(OUTPUT_DIR, index_file)
-                
-                with open(index_path, 'w', encoding='utf-8') as f:
-                    json.dump(all_projects, f, indent=2, ensure_ascii=False)
-                
                 print(f"\n✓ Saved index: {index_path}")
                 print(f"\n📁 All files saved in: {os.path.abspath(OUTPUT_DIR)}/")
             
@@ -589,6 +685,9 @@ def main():
             import traceback
             traceback.print_exc()
         finally:
+            # Don't leave an empty index behind if no table was saved
+            if os.path.exists(index_path) and not os.path.getsize(index_path):
+                os.remove(index_path)
             print("\n" + "="*70)
             input("Press Enter to close browser...")
             browser.close()